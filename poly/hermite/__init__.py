@@ -14,7 +14,10 @@ Integers are used where possible, for multiplications and for divisions like in
 from .creation import *
 from .utility import *
 from .evaluation import *
+from .functions import *
+from .quadrature import *
 from .hilbert_space import *
 from .arithmetic import *
 from .calculus import *
 from .conversion import *
+from .orthonormal import *
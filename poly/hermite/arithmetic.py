@@ -1,16 +1,21 @@
-from math import comb
-from itertools import count, islice, repeat, tee
-from .hilbert_space import hermweightis
+from fractions import Fraction
+from sys import getsizeof
+from itertools import count, repeat, tee
+from ..standard import polymul_karatsuba
+from .functions import _hermfunvander, _hermtofun, _hermfromfun
+from .quadrature import _hermquadrature
 from vector import vecbasis, vecrshift, vecpos, vecneg, vecadd, vecladd, vecaddc, vecsub, vecsubc, vecmul, vectruediv, vecltruediv, vecfloordiv, vecmod, vecdivmod, veclhadamard
 from operationcounter import MISSING, reduce_default
+import numpy as np
 
 
 
 __all__ = ('hermpos', 'hermneg', 'hermadd', 'hermaddc', 'hermsub', 'hermsubc',
            'hermscalarmul', 'hermscalartruediv', 'hermscalarfloordiv',
            'hermscalarmod', 'hermscalardivmod',
-           'hermmul', 'hermmul_naive', 'hermmulx', 'hermmulHn',
-           'hermpow', 'hermpow_naive', 'hermpow_binary', 'hermmulpow', 'hermpows')
+           'hermlinearisation', 'hermmul', 'hermmul_naive', 'hermmul_convert',
+           'hermmul_quadrature', 'hermmulx', 'hermmulHn',
+           'hermpow', 'hermpow_naive', 'hermpow_binary', 'hermpow_quadrature', 'hermmulpow', 'hermpows')
 
 
 
@@ -236,6 +241,85 @@ def hermscalardivmod(h, a):
     """
     return vecdivmod(h, a)
 
+def hermlinearisation(i, j):
+    r"""Return the linearisation coefficients of the product of two Hermite polynomials.
+    
+    $$
+        H_iH_j = \sum_{k=0}^{\min\{i,j\}}c_kH_{i+j-2k} \qquad c_k = 2^kk!\binom{i}{k}\binom{j}{k}
+    $$
+    
+    Returns the `tuple` $(c_0, c_1, \dots, c_{\min\{i,j\}})$ of `int`s.
+    
+    Cached, so the multiplication kernels don't recalculate the
+    combinatorial constants.
+    
+    Complexity
+    ----------
+    $\min\{i, j\}$ integer multiplications and divisions by the recurrence
+    
+    $$
+        c_0 = 1 \qquad c_{k+1} = \frac{2(i-k)(j-k)}{k+1}c_k
+    $$
+    
+    if not cached.
+    
+    Notes
+    -----
+    The cache is a triangular table ($c(i, j)=c(j, i)$) that grows to the
+    highest degree used so far. It is capped at 64 MiB; pairs beyond the
+    cap are calculated for every call and not cached.
+    
+    See also
+    --------
+    - used by: [`hermmul_naive`][poly.hermite.hermmul_naive],
+    [`hermmulHn`][poly.hermite.hermmulHn]
+    
+    References
+    ----------
+    - [Wikipedia - Hermite polynomials - Definition](https://en.wikipedia.org/wiki/Hermite_polynomials#Definition)
+    """
+    return _hermlinearisations(i, j)
+
+def _hermlinearisation(i, j):
+    """Return the linearisation coefficients of $H_iH_j$ by the recurrence."""
+    c = [1]
+    for k in range(min(i, j)):
+        c.append(c[-1] * 2*(i-k)*(j-k) // (k+1))
+    return tuple(c)
+
+class _TriangleCache:
+    """Symmetric table of `tuple`s of `int`s `entry(i, j)`, cached up to `maxbytes`."""
+    
+    def __init__(self, entry, maxbytes):
+        """Create an empty cache of the entries `entry(i, j)` of at most `maxbytes`."""
+        self.entry, self.maxbytes = entry, maxbytes
+        self.clear()
+    
+    def clear(self):
+        """Evict the cached entries."""
+        self.rows, self.nbytes = [], 0
+    
+    def __call__(self, i, j):
+        """Return the entry `(i, j)`, built and cached as far as needed and allowed."""
+        i, j = max(i, j), min(i, j)
+        rows = self.rows
+        if i < len(rows) and j < len(rows[i]) and rows[i][j] is not None:
+            return rows[i][j]
+        c = self.entry(i, j)
+        #entry, new empty rows & new row slots
+        newrows = max(i+1-len(rows), 0)
+        newslots = j+1 - (len(rows[i]) if i < len(rows) else 0)
+        b = getsizeof(c) + sum(map(getsizeof, c)) + getsizeof([])*newrows + 8*max(newslots, 0)
+        if self.nbytes + b <= self.maxbytes:
+            rows.extend([] for _ in range(i+1-len(rows)))
+            rows[i].extend(repeat(None, j+1-len(rows[i])))
+            rows[i][j] = c
+            self.nbytes += b
+        return c
+
+_hermlinearisations = _TriangleCache(_hermlinearisation, 1 << 26)
+
+
 def hermmul(*hs, method='naive', one=1):
     r"""Return the product of Hermite polynomial series.
     
@@ -245,13 +329,15 @@ def hermmul(*hs, method='naive', one=1):
     
     Available methods are
     
-    - [`naive`][poly.hermite.hermmul_naive].
-    
-    TODO: Karatsuba possible?
+    - [`naive`][poly.hermite.hermmul_naive],
+    - [`convert`][poly.hermite.hermmul_convert] (for high degrees) &
+    - [`quadrature`][poly.hermite.hermmul_quadrature] (for high degrees with floats).
     
     See also
     --------
-    - implementations: [`hermmul_naive`][poly.hermite.arithmetic.hermmul_naive]
+    - implementations: [`hermmul_naive`][poly.hermite.arithmetic.hermmul_naive],
+    [`hermmul_convert`][poly.hermite.arithmetic.hermmul_convert],
+    [`hermmul_quadrature`][poly.hermite.arithmetic.hermmul_quadrature]
     - for monomial factor: [`hermmulx`][poly.hermite.arithmetic.hermmulx]
     - for Hermite polynomial factor: [`hermmulHn`][poly.hermite.arithmetic.hermmulHn]
     
@@ -263,6 +349,10 @@ def hermmul(*hs, method='naive', one=1):
     match method:
         case 'naive':
             return reduce_default(hermmul_naive, hs, default=(one,))
+        case 'convert':
+            return reduce_default(hermmul_convert, hs, default=(one,))
+        case 'quadrature':
+            return reduce_default(hermmul_quadrature, hs, default=(one,))
         case _:
             raise ValueError('Invalid method')
 
@@ -304,9 +394,13 @@ def hermmul_naive(g, h):
         \end{aligned}
     $$
     
+    The coefficients are taken from the cache of
+    [`hermlinearisation`][poly.hermite.hermlinearisation].
+    
     See also
     --------
     - for any implementation: [`hermmul`][poly.hermite.arithmetic.hermmul]
+    - uses: [`hermlinearisation`][poly.hermite.hermlinearisation]
     
     References
     ----------
@@ -320,13 +414,127 @@ def hermmul_naive(g, h):
     for i, gi in enumerate(g):
         r.extend([sentinel] * (i+len(h) - len(r)))
         for j, hj in enumerate(h):
-            for k, f in enumerate(islice(hermweightis(), min(i, j)+1)):
+            for k, c in enumerate(hermlinearisation(i, j)):
                 if r[i+j-2*k] is sentinel:
-                    r[i+j-2*k] = f * comb(i, k)*comb(j, k) * gi*hj
+                    r[i+j-2*k] = c * gi*hj
                 else:
-                    r[i+j-2*k] += f * comb(i, k)*comb(j, k) * gi*hj
+                    r[i+j-2*k] += c * gi*hj
     return tuple(r)
 
+def hermmul_convert(g, h):
+    r"""Return the product of two Hermite polynomials series.
+    
+    $$
+        g h = \left(g^{(P)}h^{(P)}\right)^{(H)}
+    $$
+    
+    Converts both factors to standard monomial basis with
+    [`herm2poly_clenshaw`][poly.hermite.herm2poly_clenshaw], multiplies them
+    with [`polymul_karatsuba`][poly.standard.polymul_karatsuba] and converts
+    the product back.
+    
+    Integer series give integer results. For floating point coefficients
+    the conversions are ill conditioned for high degrees, as the monomial
+    coefficients of Hermite polynomials grow factorially.
+    
+    Complexity
+    ----------
+    For two Hermite polynomial series of degrees $n$ & $m$ there will be
+    $\mathcal{O}\left((n+m)^2\right)$ scalar operations for the conversions
+    and $\mathcal{O}\left((n+m)^{\log_23}\right)$ for the multiplication,
+    instead of $\mathcal{O}(nm\min\{n, m\})$ for
+    [`hermmul_naive`][poly.hermite.hermmul_naive].
+    
+    Notes
+    -----
+    For `int` & `Fraction` coefficients the conversion back to Hermite
+    basis uses Horner's method with the factor $2x$,
+    $2xH_k=H_{k+1}+2kH_{k-1}$, which has integer coefficients unlike $x$,
+    on $2^{n}p(x)=\sum_ka_k2^{n-k}(2x)^k$. The result is divided by $2^n$
+    once at the end. Other types are converted back by
+    [`poly2herm_horner`][poly.hermite.poly2herm_horner], as $2^n$ would
+    overflow floats beyond degree 1023.
+    
+    `conversion` imports `arithmetic`, so the conversions are imported when called.
+    
+    See also
+    --------
+    - for any implementation: [`hermmul`][poly.hermite.arithmetic.hermmul]
+    - other implementations: [`hermmul_naive`][poly.hermite.arithmetic.hermmul_naive]
+    """
+    from .conversion import herm2poly_clenshaw, poly2herm_horner
+    p = polymul_karatsuba(herm2poly_clenshaw(g), herm2poly_clenshaw(h))
+    if not all(isinstance(a, (int, Fraction)) for a in p):
+        return poly2herm_horner(p)
+    n = len(p) - 1
+    r = ()
+    for k in range(n, -1, -1):
+        r = hermaddc(_hermmul2x(r), p[k] * (1 << (n-k)))
+    return tuple(rk // (1 << n) if isinstance(rk, int) else rk / (1 << n) for rk in r)
+
+def _hermmul2x(h):
+    """Return the product of Hermite polynomial series `h` and $2x$ (integer coefficients only)."""
+    return tuple((h[k-1] if k else 0) + (2*(k+1)*h[k+1] if k+1 < len(h) else 0)
+                 for k in range(len(h)+1)) if h else h
+
+def hermmul_quadrature(g, h):
+    r"""Return the product of two Hermite polynomials series.
+    
+    $$
+        g h
+    $$
+    
+    Uses pseudo-spectral multiplication with floats: both factors are
+    evaluated on Gauss-Hermite nodes, multiplied pointwise and projected
+    back with the quadrature weights. The nodes, weights and basis matrix
+    are cached per number of nodes.
+    
+    Returns a `tuple` of `float`s.
+    
+    Complexity
+    ----------
+    For two Hermite polynomial series of degrees $n$ & $m$ there will be
+    $\mathcal{O}\left((n+m)^2\right)$ floating point operations in `numpy`
+    matrix-vector products (plus $\mathcal{O}\left((n+m)^2\right)$ for the
+    basis matrix if not cached).
+    
+    Notes
+    -----
+    With the orthonormal Hermite functions
+    $\psi_k(x)=\frac{H_k(x)e^{-\frac{x^2}{2}}}{\sqrt{2^kk!\sqrt{\pi}}}$ and
+    the $N=n+m+1$ Gauss-Hermite nodes $x_i$ and weights $w_i$ the coefficients
+    of the product of degree $n+m$ are exactly
+    
+    $$
+        (gh)_k = \frac{1}{\sqrt{2^kk!\sqrt{\pi}}}\sum_{i=1}^N\Lambda_i\left(g(x_i)e^{-\frac{x_i^2}{4}}\right)\left(h(x_i)e^{-\frac{x_i^2}{4}}\right)\psi_k(x_i)
+    $$
+    
+    with the scaled weights $\Lambda_i=w_ie^{x_i^2}=\frac{1}{\sum_{k<N}\psi_k^2(x_i)}$.
+    Splitting $e^{-\frac{x^2}{2}}$ onto both factors and calculating all
+    values by the orthonormal three-term recurrence avoids the over- and
+    underflow of $H_k(x_i)$ and $w_i$ for high degrees.
+    
+    See also
+    --------
+    - for any implementation: [`hermmul`][poly.hermite.arithmetic.hermmul]
+    - other implementations: [`hermmul_naive`][poly.hermite.arithmetic.hermmul_naive],
+    [`hermmul_convert`][poly.hermite.arithmetic.hermmul_convert]
+    - for powers: [`hermpow_quadrature`][poly.hermite.arithmetic.hermpow_quadrature]
+    - nodes & weights: [`hermgauss`][poly.hermite.hermgauss]
+    
+    References
+    ----------
+    - [Wikipedia - Gauss–Hermite quadrature](https://en.wikipedia.org/wiki/Gauss%E2%80%93Hermite_quadrature)
+    - [Wikipedia - Hermite polynomials - Hermite functions](https://en.wikipedia.org/wiki/Hermite_polynomials#Hermite_functions)
+    """
+    g, h = np.asarray(tuple(g), dtype=float), np.asarray(tuple(h), dtype=float)
+    if not g.size or not h.size:
+        return () #hermzero
+    x, W, Psi = _hermquadrature(g.size + h.size - 1)
+    G = _hermfunvander(x, g.size-1, 1/4) @ _hermtofun(g)
+    H = _hermfunvander(x, h.size-1, 1/4) @ _hermtofun(h)
+    return tuple(_hermfromfun(Psi.T @ (W * G * H)).tolist())
+
 def hermmulx(h, zero=0):
     r"""Return the product of Hermite polynomial series `h` and a monomial of degree `n`.
     
@@ -396,15 +604,16 @@ def hermmulHn(h, n, zero=0):
     See also
     --------
     - for a Hermite polynomial series factor: [`hermmul`][poly.hermite.arithmetic.hermmul]
+    - uses: [`hermlinearisation`][poly.hermite.hermlinearisation]
     """
     r = []
     for i, hi in enumerate(h):
         r.extend([zero] * (i+n - len(r)+1))
-        for k, f in enumerate(islice(hermweightis(), min(i, n)+1)):
+        for k, c in enumerate(hermlinearisation(i, n)):
             if r[i+n-2*k] is zero:
-                r[i+n-2*k] = f * comb(i, k)*comb(n, k) * hi
+                r[i+n-2*k] = c * hi
             else:
-                r[i+n-2*k] += f * comb(i, k)*comb(n, k) * hi
+                r[i+n-2*k] += c * hi
     return tuple(r)
 
 def hermpow(h, n, method='binary'):
@@ -418,13 +627,15 @@ def hermpow(h, n, method='binary'):
     
     Available methods are 
     
-    - [`naive`][poly.hermite.hermpow_naive] &
-    - [`binary`][poly.hermite.hermpow_binary].
+    - [`naive`][poly.hermite.hermpow_naive],
+    - [`binary`][poly.hermite.hermpow_binary] &
+    - [`quadrature`][poly.hermite.hermpow_quadrature] (for high degrees with floats).
     
     See also
     --------
     - implementations: [`hermpow_naive`][poly.hermite.hermpow_naive],
     [`hermpow_binary`][poly.hermite.hermpow_binary],
+    [`hermpow_quadrature`][poly.hermite.hermpow_quadrature]
     - `numpy` equivalent: [`numpy.polynomial.hermite.hermpow`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.hermite.hermpow.html)
     """
     match method:
@@ -432,6 +643,8 @@ def hermpow(h, n, method='binary'):
             return hermpow_naive(h, n)
         case 'binary':
             return hermpow_binary(h, n)
+        case 'quadrature':
+            return hermpow_quadrature(h, n)
         case _:
             raise ValueError('Invalid method')
 
@@ -483,6 +696,46 @@ def hermpow_binary(h, n, one=1):
         n //= 2
     return r
 
+def hermpow_quadrature(h, n):
+    r"""Return the Hermite polynomial series `h` raised to the nonnegative `n`-th power.
+    
+    $$
+        h^n
+    $$
+    
+    Uses pseudo-spectral exponentiation with floats like
+    [`hermmul_quadrature`][poly.hermite.hermmul_quadrature]: `h` is
+    evaluated once on the Gauss-Hermite nodes, raised to the `n`-th power
+    pointwise and projected back.
+    
+    Returns a `tuple` of `float`s.
+    
+    Complexity
+    ----------
+    For a Hermite polynomial series of degree $m$ there will be
+    $\mathcal{O}\left((nm)^2\right)$ floating point operations in `numpy`
+    matrix-vector products.
+    
+    Notes
+    -----
+    The factor $e^{-\frac{x^2}{2}}$ is split as $e^{-\frac{x^2}{2n}}$ onto
+    every factor.
+    
+    See also
+    --------
+    - for any implementation: [`hermpow`][poly.hermite.hermpow]
+    - other implementations: [`hermpow_naive`][poly.hermite.hermpow_naive],
+    [`hermpow_binary`][poly.hermite.hermpow_binary]
+    """
+    h = np.asarray(tuple(h), dtype=float)
+    if n == 0:
+        return (1.0,) #hermone
+    if not h.size:
+        return () #hermzero
+    x, W, Psi = _hermquadrature(n*(h.size-1) + 1)
+    H = _hermfunvander(x, h.size-1, 1/(2*n)) @ _hermtofun(h)
+    return tuple(_hermfromfun(Psi.T @ (W * H**n)).tolist())
+
 def hermmulpow(alpha, one=1):
     r"""Return product of Hermite Polynomials.
     
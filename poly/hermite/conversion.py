@@ -1,15 +1,21 @@
+from math import lcm
+from sys import getsizeof
+from fractions import Fraction
 from itertools import count
 from ..standard import polyzero, polyadd, polyaddc, polysub, polyscalarmul, polymulx
-from .arithmetic import hermadd, hermaddc, hermscalarmul, hermmulx
-from .creation import hermzero, herms, herm_explicit, hermmono, hermmonos
+from .arithmetic import hermadd, hermaddc, hermscalarmul, hermmulx, _hermmul2x
+from .creation import hermzero, herms, herm_explicit, hermmono, hermmonos, hermmono_explicit
 from vector import vecdot
+import numpy as np
 import sympy as sp
 from sympy.abc import x
 
 
 
 __all__ = ('herm2poly', 'herm2poly_naive', 'herm2poly_iterative', 'herm2poly_clenshaw',
+           'herm2poly_rational', 'herm2poly_matrix',
            'poly2herm', 'poly2herm_naive', 'poly2herm_iterative', 'poly2herm_horner',
+           'poly2herm_rational', 'poly2herm_matrix',
            'hermsympify')
 
 
@@ -24,14 +30,18 @@ def herm2poly(h, method='iterative'):
     Available methods are 
     
     - [`naive`][poly.hermite.herm2poly_naive],
-    - [`iterative`][poly.hermite.herm2poly_iterative] &
-    - [`clenshaw`][poly.hermite.herm2poly_clenshaw].
+    - [`iterative`][poly.hermite.herm2poly_iterative],
+    - [`clenshaw`][poly.hermite.herm2poly_clenshaw],
+    - [`rational`][poly.hermite.herm2poly_rational] (exact, for `int`s & `Fraction`s) &
+    - [`matrix`][poly.hermite.herm2poly_matrix] (for repeated conversions).
     
     See also
     --------
     - implementations: [`herm2poly_naive`][poly.hermite.herm2poly_naive],
     [`herm2poly_iterative`][poly.hermite.herm2poly_iterative],
-    [`herm2poly_clenshaw`][poly.hermite.herm2poly_clenshaw]
+    [`herm2poly_clenshaw`][poly.hermite.herm2poly_clenshaw],
+    [`herm2poly_rational`][poly.hermite.herm2poly_rational],
+    [`herm2poly_matrix`][poly.hermite.herm2poly_matrix]
     
     References
     ----------
@@ -44,6 +54,10 @@ def herm2poly(h, method='iterative'):
             return herm2poly_iterative(h)
         case 'clenshaw':
             return herm2poly_clenshaw(h)
+        case 'rational':
+            return herm2poly_rational(h)
+        case 'matrix':
+            return herm2poly_matrix(h)
         case _:
             raise ValueError('Invalid method')
 
@@ -129,6 +143,170 @@ def herm2poly_clenshaw(h):
         a, b = polyaddc(polysub(polyscalarmul(2, polymulx(a)), polyscalarmul(2*(n+1), b)), hn), a
     return polyaddc(polysub(polyscalarmul(2, polymulx(a)), polyscalarmul(2, b)), h[0])
 
+def herm2poly_rational(h):
+    r"""Return the exact rational Hermite polynomial series `h` in standard monomial basis.
+    
+    $$
+        h^{(P)}
+    $$
+    
+    Coefficients may be `int`s or `Fraction`s (anything with `numerator`
+    and `denominator`). Brings them to their least common denominator $D$
+    and uses [`herm2poly_clenshaw`][poly.hermite.herm2poly_clenshaw] on
+    the integer numerators, so a single `Fraction` is normalised per
+    coefficient instead of one per operation.
+    
+    Returns a `tuple` of `Fraction`s.
+    
+    Complexity
+    ----------
+    For a Hermite polynomial series of degree $n$ there will be the integer
+    operations of [`herm2poly_clenshaw`][poly.hermite.herm2poly_clenshaw]
+    and $n+1$ `Fraction` normalisations.
+    
+    See also
+    --------
+    - for any implementation: [`herm2poly`][poly.hermite.herm2poly]
+    - other implementations: [`herm2poly_naive`][poly.hermite.herm2poly_naive],
+    [`herm2poly_iterative`][poly.hermite.herm2poly_iterative],
+    [`herm2poly_clenshaw`][poly.hermite.herm2poly_clenshaw]
+    - inverse: [`poly2herm_rational`][poly.hermite.poly2herm_rational]
+    """
+    h = tuple(h)
+    if not h:
+        return polyzero
+    D = lcm(*(a.denominator for a in h))
+    return tuple(Fraction(pk, D) for pk in herm2poly_clenshaw(a.numerator * (D // a.denominator) for a in h))
+
+def herm2poly_matrix(h):
+    r"""Return a Hermite polynomial series in standard monomial basis.
+    
+    $$
+        h^{(P)}
+    $$
+    
+    Uses a cached conversion matrix, whose rows are the Hermite polynomials
+    in standard monomial basis by [`herm_explicit`][poly.hermite.herm_explicit],
+    so repeated conversions don't rebuild them.
+    
+    A `numpy.ndarray` is multiplied with a cached float matrix instead and
+    an array is returned. Multidimensional arrays hold one series along the
+    last axis, so many series of the same degree are converted with a
+    single matrix-matrix product. Arrays of `dtype=object` (e.g. of `int`s
+    or `Fraction`s) are multiplied with the exact rows instead.
+    
+    Complexity
+    ----------
+    For a Hermite polynomial series of degree $n$ there will be
+    
+    - $\frac{(n+1)(n+2)}{2}$ scalar multiplications (`mul`) &
+    - $\frac{n(n+1)}{2}$ scalar additions (`add`),
+    
+    plus $\mathcal{O}(n^2)$ operations to extend the matrix if not cached.
+    
+    Notes
+    -----
+    There is one cached table of exact rows and one float matrix. Both
+    grow to the highest degree converted so far and are sliced for lower
+    degrees. Each is capped at 64 MiB; rows beyond the cap are built for
+    every call and not cached.
+    
+    The float matrix overflows for degrees above about 170.
+    
+    See also
+    --------
+    - for any implementation: [`herm2poly`][poly.hermite.herm2poly]
+    - other implementations: [`herm2poly_naive`][poly.hermite.herm2poly_naive],
+    [`herm2poly_iterative`][poly.hermite.herm2poly_iterative],
+    [`herm2poly_clenshaw`][poly.hermite.herm2poly_clenshaw],
+    [`herm2poly_rational`][poly.hermite.herm2poly_rational]
+    - inverse: [`poly2herm_matrix`][poly.hermite.poly2herm_matrix]
+    """
+    if isinstance(h, np.ndarray):
+        n = h.shape[-1]
+        if h.dtype == object:
+            return h @ _objectarray(_herm2polyrows(n), n)
+        return h @ _herm2polyarray(n)
+    h = tuple(h)
+    return polyadd(*map(polyscalarmul, h, _herm2polyrows(len(h))))
+
+class _RowCache:
+    """Rows `row(k)` of a conversion matrix, cached up to `maxbytes`."""
+    
+    def __init__(self, row, maxbytes):
+        """Create an empty cache of the rows `row(k)` of at most `maxbytes`."""
+        self.row, self.maxbytes = row, maxbytes
+        self.clear()
+    
+    def clear(self):
+        """Evict the cached rows."""
+        self.rows, self.nbytes = [], 0
+    
+    def __call__(self, n):
+        """Return the first `n` rows, built and cached as far as needed and allowed."""
+        while len(self.rows) < n:
+            r = self.row(len(self.rows))
+            b = _nbytes(r)
+            if self.nbytes + b > self.maxbytes:
+                return self.rows + [r] + [self.row(k) for k in range(len(self.rows)+1, n)]
+            self.rows.append(r)
+            self.nbytes += b
+        return self.rows[:n]
+
+class _ArrayCache:
+    """Lower triangular conversion matrix grown by `extend`, cached up to `maxbytes`."""
+    
+    def __init__(self, extend, maxbytes):
+        """Create an empty cache of the matrix grown by `extend` of at most `maxbytes`."""
+        self.extend, self.maxbytes = extend, maxbytes
+        self.clear()
+    
+    def clear(self):
+        """Evict the cached matrix."""
+        self.A = np.zeros((0, 0))
+    
+    def __call__(self, n):
+        """Return the read-only matrix of shape `(n, n)`, extended and cached as far as needed and allowed."""
+        A = self.A
+        if A.shape[0] < n:
+            A = self.extend(A, n)
+            A.flags.writeable = False
+            if A.nbytes <= self.maxbytes:
+                self.A = A
+        return A[:n, :n]
+
+def _nbytes(r):
+    """Return the approximate memory of a `tuple` of `int`s or `Fraction`s in bytes."""
+    return getsizeof(r) + sum(getsizeof(c) + getsizeof(c.numerator) + getsizeof(c.denominator)
+                              if isinstance(c, Fraction) else getsizeof(c) for c in r)
+
+def _objectarray(rows, n):
+    """Return the rows padded with zeros to an object array of shape `(n, n)`."""
+    A = np.zeros((n, n), dtype=object)
+    for k, r in enumerate(rows):
+        A[k, :len(r)] = r
+    return A
+
+def _herm2polyextend(A, N):
+    """Return the first `N` Hermite polynomials in standard monomial basis as rows of a float array, extending the first rows `A`."""
+    #H_{k+1} = 2xH_k - 2kH_{k-1}
+    m = A.shape[0]
+    B = np.zeros((N, N))
+    B[:m, :m] = A
+    with np.errstate(over='ignore', invalid='ignore'):
+        for k in range(m, N):
+            if k == 0:
+                B[0, 0] = 1
+            elif k == 1:
+                B[1, 1] = 2
+            else:
+                B[k, 1:] = 2 * B[k-1, :-1]
+                B[k] -= 2*(k-1) * B[k-2]
+    return B
+
+_herm2polyrows = _RowCache(herm_explicit, 1 << 26)
+_herm2polyarray = _ArrayCache(_herm2polyextend, 1 << 26)
+
 def poly2herm(p, method='iterative'):
     """Return a standard monomial basis polynomials as a Hermite polynomial series.
     
@@ -139,14 +317,18 @@ def poly2herm(p, method='iterative'):
     Available methods are 
     
     - [`naive`][poly.hermite.poly2herm_naive],
-    - [`iterative`][poly.hermite.poly2herm_iterative] &
-    - [`horner`][poly.hermite.poly2herm_horner].
+    - [`iterative`][poly.hermite.poly2herm_iterative],
+    - [`horner`][poly.hermite.poly2herm_horner],
+    - [`rational`][poly.hermite.poly2herm_rational] (exact, for `int`s & `Fraction`s) &
+    - [`matrix`][poly.hermite.poly2herm_matrix] (for repeated conversions).
     
     See also
     --------
     - implementations: [`poly2herm_naive`][poly.hermite.poly2herm_naive],
     [`poly2herm_iterative`][poly.hermite.poly2herm_iterative],
-    [`poly2herm_horner`][poly.hermite.poly2herm_horner]
+    [`poly2herm_horner`][poly.hermite.poly2herm_horner],
+    [`poly2herm_rational`][poly.hermite.poly2herm_rational],
+    [`poly2herm_matrix`][poly.hermite.poly2herm_matrix]
     
     References
     ----------
@@ -159,6 +341,10 @@ def poly2herm(p, method='iterative'):
             return poly2herm_iterative(p)
         case 'horner':
             return poly2herm_horner(p)
+        case 'rational':
+            return poly2herm_rational(p)
+        case 'matrix':
+            return poly2herm_matrix(p)
         case _:
             raise ValueError('Invalid method')
 
@@ -223,6 +409,127 @@ def poly2herm_horner(p):
         r = hermaddc(hermmulx(r), pi)
     return r
 
+def poly2herm_rational(p):
+    r"""Return the exact rational standard monomial basis polynomial `p` as a Hermite polynomial series.
+    
+    $$
+        p^{(H)}
+    $$
+    
+    Coefficients may be `int`s or `Fraction`s (anything with `numerator`
+    and `denominator`). Uses Horner's method in the factor $2x$ on integers
+    only and normalises a single `Fraction` per coefficient at the end,
+    instead of working in `Fraction`s throughout like
+    [`poly2herm_iterative`][poly.hermite.poly2herm_iterative].
+    
+    Returns a `tuple` of `Fraction`s.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be
+    
+    - $\frac{n(n+1)}{2}$ integer additions (`add`),
+    - $\frac{n(n-1)}{2}$ integer multiplications (`mul`) &
+    - $n+1$ `Fraction` normalisations.
+    
+    Notes
+    -----
+    With the least common denominator $D$ of the coefficients
+    
+    $$
+        p(x) = \frac{1}{2^nD}\sum_{k=0}^n2^{n-k}Dp_k(2x)^k
+    $$
+    
+    and multiplication by $2x$, $2xH_k=H_{k+1}+2kH_{k-1}$, keeps integer
+    Hermite series integer.
+    
+    See also
+    --------
+    - for any implementation: [`poly2herm`][poly.hermite.poly2herm]
+    - other implementations: [`poly2herm_naive`][poly.hermite.poly2herm_naive],
+    [`poly2herm_iterative`][poly.hermite.poly2herm_iterative],
+    [`poly2herm_horner`][poly.hermite.poly2herm_horner]
+    - inverse: [`herm2poly_rational`][poly.hermite.herm2poly_rational]
+    
+    References
+    ----------
+    - [Wikipedia - Horner's method](https://en.wikipedia.org/wiki/Horner%27s_method)
+    """
+    p = tuple(p)
+    if not p:
+        return hermzero
+    n, D = len(p) - 1, lcm(*(a.denominator for a in p))
+    r = hermzero
+    for k in range(n, -1, -1):
+        r = hermaddc(_hermmul2x(r), p[k].numerator * (D // p[k].denominator) << (n-k))
+    return tuple(Fraction(rk, D << n) for rk in r)
+
+def poly2herm_matrix(p):
+    r"""Return a standard monomial basis polynomials as a Hermite polynomial series.
+    
+    $$
+        p^{(H)}
+    $$
+    
+    Uses a cached conversion matrix, whose rows are the monomials as
+    Hermite polynomial series by
+    [`hermmono_explicit`][poly.hermite.hermmono_explicit] (`Fraction`s),
+    so repeated conversions don't rebuild them.
+    
+    A `numpy.ndarray` is multiplied with a cached float matrix instead and
+    an array is returned. Multidimensional arrays hold one polynomial
+    along the last axis, so many polynomials of the same degree are
+    converted with a single matrix-matrix product. Arrays of
+    `dtype=object` (e.g. of `int`s or `Fraction`s) are multiplied with the
+    exact rows instead.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be
+    
+    - $\frac{(n+1)(n+2)}{2}$ scalar multiplications (`mul`) &
+    - $\frac{n(n+1)}{2}$ scalar additions (`add`),
+    
+    plus $\mathcal{O}(n^2)$ operations to extend the matrix if not cached.
+    
+    Notes
+    -----
+    Caching like [`herm2poly_matrix`][poly.hermite.herm2poly_matrix].
+    
+    See also
+    --------
+    - for any implementation: [`poly2herm`][poly.hermite.poly2herm]
+    - other implementations: [`poly2herm_naive`][poly.hermite.poly2herm_naive],
+    [`poly2herm_iterative`][poly.hermite.poly2herm_iterative],
+    [`poly2herm_horner`][poly.hermite.poly2herm_horner],
+    [`poly2herm_rational`][poly.hermite.poly2herm_rational]
+    - inverse: [`herm2poly_matrix`][poly.hermite.herm2poly_matrix]
+    """
+    if isinstance(p, np.ndarray):
+        n = p.shape[-1]
+        if p.dtype == object:
+            return p @ _objectarray(_poly2hermrows(n), n)
+        return p @ _poly2hermarray(n)
+    p = tuple(p)
+    return hermadd(*map(hermscalarmul, p, _poly2hermrows(len(p))))
+
+def _poly2hermextend(A, N):
+    """Return the first `N` monomials as Hermite polynomial series as rows of a float array, extending the first rows `A`."""
+    #xH_i = H_{i+1}/2 + iH_{i-1}
+    m = A.shape[0]
+    B = np.zeros((N, N))
+    B[:m, :m] = A
+    for k in range(m, N):
+        if k == 0:
+            B[0, 0] = 1
+        else:
+            B[k, 1:] = B[k-1, :-1] / 2
+            B[k, :-1] += np.arange(1, N) * B[k-1, 1:]
+    return B
+
+_poly2hermrows = _RowCache(hermmono_explicit, 1 << 26)
+_poly2hermarray = _ArrayCache(_poly2hermextend, 1 << 26)
+
 def hermsympify(h, x=x):
     """Return the Hermite polynomial series `h` as a [`sympy.Poly`](https://docs.sympy.org/latest/modules/polys/reference.html#sympy.polys.polytools.Poly)."""
     return vecdot(h, (sp.hermite_poly(i, x, polys=True) for i in count()), zero=sp.Poly(0, x))
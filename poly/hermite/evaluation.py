@@ -1,12 +1,16 @@
+from math import lcm
+from fractions import Fraction
 from itertools import count, islice
 from ..standard import polyval
 from .conversion import herm2poly
 from vector import vecdot
+import numpy as np
 
 
 
-__all__ = ('hermval', 'hermval_naive', 'hermval_iterative', 'hermval_clenshaw',
-           'hermvals', 'hermvalzeros', 'hermvalzero')
+__all__ = ('hermval', 'hermval_naive', 'hermval_iterative', 'hermval_clenshaw', 'hermval_rational',
+           'hermval_vectorised', 'hermval_mod',
+           'hermvals', 'hermvander', 'hermvalzeros', 'hermvalzero')
 
 
 
@@ -20,14 +24,19 @@ def hermval(h, x, method='clenshaw'):
     Available methods are
     
     - [`naive`][poly.hermite.hermval_naive],
-    - [`iterative`][poly.hermite.hermval_iterative] &
-    - [`clenshaw`][poly.hermite.hermval_clenshaw] (`h` must be reversible).
+    - [`iterative`][poly.hermite.hermval_iterative],
+    - [`clenshaw`][poly.hermite.hermval_clenshaw] (`h` must be reversible),
+    - [`rational`][poly.hermite.hermval_rational]
+    (for exact `int`/`Fraction` coefficients and arguments) &
+    - [`vectorised`][poly.hermite.hermval_vectorised] (for arrays of points).
     
     See also
     --------
     - implementations: [`hermval_naive`][poly.hermite.hermval_naive],
     [`hermval_iterative`][poly.hermite.hermval_iterative],
-    [`hermval_clenshaw`][poly.hermite.hermval_clenshaw]
+    [`hermval_clenshaw`][poly.hermite.hermval_clenshaw],
+    [`hermval_rational`][poly.hermite.hermval_rational],
+    [`hermval_vectorised`][poly.hermite.hermval_vectorised]
     - in standard monomial basis: [`polyval`][poly.standard.polyval]
     
     References
@@ -41,6 +50,10 @@ def hermval(h, x, method='clenshaw'):
             return hermval_iterative(h, x)
         case 'clenshaw':
             return hermval_clenshaw(h, x)
+        case 'rational':
+            return hermval_rational(h, x)
+        case 'vectorised':
+            return hermval_vectorised(h, x)
         case _:
             raise ValueError('Invalid method')
 
@@ -97,6 +110,8 @@ def hermval_clenshaw(h, x):
     - for any implementation: [`hermval`][poly.hermite.hermval]
     - other implementations: [`hermval_naive`][poly.hermite.hermval_naive],
     [`hermval_iterative`][poly.hermite.hermval_iterative]
+    - for exact rational arguments: [`hermval_rational`][poly.hermite.hermval_rational]
+    - for arrays of points: [`hermval_vectorised`][poly.hermite.hermval_vectorised]
     - in standard monomial basis: [`polyval_horner`][poly.standard.polyval_horner]
     
     References
@@ -107,10 +122,137 @@ def hermval_clenshaw(h, x):
     if not h:
         return type(x)(0)
     a, b = 0, 0
-    for n, hn in reversed(tuple(enumerate(h[1:], 1))):
-        a, b = hn + 2*x*a - 2*(n+1)*b, a
+    for n in range(len(h)-1, 0, -1):
+        a, b = h[n] + 2*x*a - 2*(n+1)*b, a
     return h[0] + 2*x*a - 2*b
 
+def hermval_rational(h, x):
+    r"""Return the exact value of rational Hermite series `h` evaluated at rational point `x`.
+    
+    $$
+        h\left(\frac{u}{v}\right)
+    $$
+    
+    Coefficients and `x` may be `int`s or `Fraction`s (anything with
+    `numerator` and `denominator`). Uses the Clenshaw algorithm scaled to
+    integers and normalises a single `Fraction` at the end instead of one
+    per step.
+    
+    Notes
+    -----
+    With $B_k=v^{n-k}b_k$ the Clenshaw recurrence
+    $b_k=h_k+2xb_{k+1}-2(k+1)b_{k+2}$ becomes the integer recurrence
+    
+    $$
+        B_k = h_kv^{n-k} + 2uB_{k+1} - 2(k+1)v^2B_{k+2}
+    $$
+    
+    and the result is $\frac{h_0v^n+2uB_1-2v^2B_2}{v^n}$.
+    Fractional coefficients are brought to their least common denominator first.
+    
+    See also
+    --------
+    - for any implementation: [`hermval`][poly.hermite.hermval]
+    - other implementations: [`hermval_clenshaw`][poly.hermite.hermval_clenshaw]
+    - in standard monomial basis: [`polyval_rational`][poly.standard.polyval_rational]
+    
+    References
+    ----------
+    - [Wikipedia - Clenshaw algorithm](https://en.wikipedia.org/wiki/Clenshaw_algorithm)
+    """
+    h = tuple(h)
+    if not h:
+        return Fraction(0)
+    D = lcm(*(hk.denominator for hk in h))
+    h = tuple(hk.numerator * (D // hk.denominator) for hk in h)
+    u, v = x.numerator, x.denominator
+    vv, vk = v*v, 1
+    a, b = 0, 0
+    for n in range(len(h)-1, 0, -1):
+        a, b = h[n]*vk + 2*u*a - 2*(n+1)*vv*b, a
+        vk *= v
+    return Fraction(h[0]*vk + 2*u*a - 2*vv*b, D*vk)
+
+def hermval_vectorised(h, x):
+    r"""Return the values of Hermite polynomial series `h` evaluated at points `x`.
+    
+    $$
+        h(x_i)
+    $$
+    
+    Uses the Clenshaw algorithm like
+    [`hermval_clenshaw`][poly.hermite.hermval_clenshaw], but every step is
+    an in-place `numpy` operation on all points at once instead of a Python
+    loop per point.
+    
+    `x` may be a scalar or an array of any shape, the result is a
+    `numpy.ndarray` of the same shape (or a scalar).
+    
+    Complexity
+    ----------
+    For a Hermite polynomial series of degree $n$ and $m$ points there will
+    be $\mathcal{O}(nm)$ array element operations and three temporary arrays
+    of the size of `x`.
+    
+    See also
+    --------
+    - for any implementation: [`hermval`][poly.hermite.hermval]
+    - other implementations: [`hermval_clenshaw`][poly.hermite.hermval_clenshaw]
+    - for all Hermite polynomials at the points: [`hermvander`][poly.hermite.hermvander]
+    
+    References
+    ----------
+    - [Wikipedia - Clenshaw algorithm](https://en.wikipedia.org/wiki/Clenshaw_algorithm)
+    - `numpy` equivalent: [`numpy.polynomial.hermite.hermval`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.hermite.hermval.html)
+    """
+    h, x = tuple(h), np.asarray(x)
+    dtype = np.result_type(x, *h, float)
+    a, b, t = np.zeros(x.shape, dtype), np.zeros(x.shape, dtype), np.empty(x.shape, dtype)
+    x2 = 2 * x
+    for n in range(len(h)-1, 0, -1):
+        #b <- h_n + 2x*a - 2(n+1)*b, then swap to a, b <- b, a
+        b *= -2*(n+1)
+        b += h[n]
+        np.multiply(x2, a, out=t)
+        b += t
+        a, b = b, a
+    if not h:
+        return b[()]
+    b *= -2
+    b += h[0]
+    np.multiply(x2, a, out=t)
+    b += t
+    return b[()]
+
+def hermval_mod(h, x, m):
+    r"""Return the value of integer Hermite series `h` evaluated at point `x` modulo `m`.
+    
+    $$
+        h(x) \bmod m
+    $$
+    
+    Uses the Clenshaw algorithm and reduces modulo $m$ at every step.
+    Allows to check basis conversions like [`herm2poly`][poly.hermite.herm2poly]
+    with [`polyeq_probabilistic`][poly.standard.polyeq_probabilistic]
+    without forming the converted coefficients.
+    
+    See also
+    --------
+    - for any implementation: [`hermval`][poly.hermite.hermval]
+    - in standard monomial basis: [`polyval_mod`][poly.standard.polyval_mod]
+    
+    References
+    ----------
+    - [Wikipedia - Clenshaw algorithm](https://en.wikipedia.org/wiki/Clenshaw_algorithm)
+    """
+    h = tuple(h)
+    if not h:
+        return 0
+    a, b = 0, 0
+    for n in range(len(h)-1, 0, -1):
+        a, b = (h[n] + 2*x*a - 2*(n+1)*b) % m, a
+    return (h[0] + 2*x*a - 2*b) % m
+
 def hermvals(x):
     r"""Yield the values of Hermite polynomials evaluated at point `x`.
     
@@ -134,6 +276,41 @@ def hermvals(x):
         Hkm1, Hk = Hk, 2*(Hk*x - k*Hkm1)
         yield Hk
 
+def hermvander(x, n):
+    r"""Return the values of the Hermite polynomials up to degree `n` evaluated at points `x`.
+    
+    $$
+        V_{ik} = H_k(x_i) \qquad k=0, \dots, n
+    $$
+    
+    Uses the recurrence relation $H_{k+1}(x)=2xH_k(x)-2kH_{k-1}(x)$ on all
+    points at once.
+    
+    Returns a `numpy.ndarray` of shape `x.shape + (n+1,)`, so a series is
+    evaluated at all points by `hermvander(x, n) @ h`.
+    
+    Complexity
+    ----------
+    For $m$ points there will be $\mathcal{O}(nm)$ array element operations.
+    
+    See also
+    --------
+    - for a single point: [`hermvals`][poly.hermite.hermvals]
+    - for a single series: [`hermval_vectorised`][poly.hermite.hermval_vectorised]
+    
+    References
+    ----------
+    - `numpy` equivalent: [`numpy.polynomial.hermite.hermvander`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.hermite.hermvander.html)
+    """
+    x = np.asarray(x)
+    V = np.empty((n+1,) + x.shape, np.result_type(x, float))
+    V[0] = 1
+    if n >= 1:
+        V[1] = 2 * x
+    for k in range(1, n):
+        V[k+1] = 2 * (x*V[k] - k*V[k-1])
+    return np.moveaxis(V, 0, -1)
+
 def hermvalzeros():
     r"""Yield the values of Hermite polynomials evaluated at point 0.
     
@@ -0,0 +1,228 @@
+from math import log, pi, sqrt
+from itertools import count
+import numpy as np
+
+
+
+__all__ = ('hermfunval', 'hermfunval_recurrence', 'hermfunval_clenshaw',
+           'hermfunvals', 'hermfunvander')
+
+
+
+def hermfunval(c, x, method='recurrence'):
+    r"""Return the value of a series in orthonormal Hermite functions evaluated at points `x`.
+    
+    $$
+        \sum_{k=0}^nc_k\psi_k(x) \qquad \psi_k(x) = \frac{H_k(x)e^{-\frac{x^2}{2}}}{\sqrt{2^kk!\sqrt{\pi}}}
+    $$
+    
+    Available methods are
+    
+    - [`recurrence`][poly.hermite.hermfunval_recurrence] &
+    - [`clenshaw`][poly.hermite.hermfunval_clenshaw].
+    
+    Both are vectorised over `x` with `numpy` and stay in floating point
+    range for degrees far beyond the overflow of $H_n(x)$ (about 150).
+    
+    See also
+    --------
+    - implementations: [`hermfunval_recurrence`][poly.hermite.hermfunval_recurrence],
+    [`hermfunval_clenshaw`][poly.hermite.hermfunval_clenshaw]
+    - for Hermite polynomial series: [`hermval`][poly.hermite.hermval]
+    
+    References
+    ----------
+    - [Wikipedia - Hermite polynomials - Hermite functions](https://en.wikipedia.org/wiki/Hermite_polynomials#Hermite_functions)
+    """
+    match method:
+        case 'recurrence':
+            return hermfunval_recurrence(c, x)
+        case 'clenshaw':
+            return hermfunval_clenshaw(c, x)
+        case _:
+            raise ValueError('Invalid method')
+
+def hermfunval_recurrence(c, x):
+    r"""Return the value of a series in orthonormal Hermite functions evaluated at points `x`.
+    
+    $$
+        \sum_{k=0}^nc_k\psi_k(x)
+    $$
+    
+    Uses the orthonormal three-term recurrence
+    
+    $$
+        \psi_{k+1}(x) = \sqrt{\frac{2}{k+1}}x\psi_k(x) - \sqrt{\frac{k}{k+1}}\psi_{k-1}(x)
+    $$
+    
+    on all points at once and accumulates the sum on the way.
+    
+    `x` may be a scalar or an array of any shape, the result is a
+    `numpy.ndarray` of the same shape (or a scalar).
+    
+    Complexity
+    ----------
+    For a series of degree $n$ and $m$ points there will be
+    $\mathcal{O}(nm)$ array element operations.
+    
+    Notes
+    -----
+    The recurrence runs on $\psi_k(x)e^{-s(x)}$ with a logarithmic scale
+    $s(x)$, starting from $s(x)=\ln\psi_0(x)=-\frac{x^2}{2}-\frac{\ln\pi}{4}$,
+    so $e^{-\frac{x^2}{2}}$ is never formed on its own, where it would
+    underflow. Whenever the scaled values exceed $2^{300}$ they are
+    rescaled by $2^{-300}$ and the scale is adjusted, so neither the
+    polynomial part nor the Gaussian over- or underflow.
+    
+    See also
+    --------
+    - for any implementation: [`hermfunval`][poly.hermite.hermfunval]
+    - other implementations: [`hermfunval_clenshaw`][poly.hermite.hermfunval_clenshaw]
+    - for all functions at the points: [`hermfunvander`][poly.hermite.hermfunvander]
+    """
+    c, x = tuple(c), np.asarray(x)
+    dtype = np.result_type(x, *c, float)
+    if not c:
+        return np.zeros(x.shape, dtype)[()]
+    r = np.zeros(x.shape, dtype)
+    for ck, (_, u, s, big) in zip(c, _hermfunrecurrence(x)):
+        if big is not None:
+            r = np.where(big, r * 2.0**-300, r)
+        r += ck * u
+    return (r * np.exp(s))[()]
+
+def hermfunval_clenshaw(c, x):
+    r"""Return the value of a series in orthonormal Hermite functions evaluated at points `x`.
+    
+    $$
+        \sum_{k=0}^nc_k\psi_k(x)
+    $$
+    
+    Uses the Clenshaw algorithm on the orthonormal three-term recurrence
+    on all points at once.
+    
+    `x` may be a scalar or an array of any shape, the result is a
+    `numpy.ndarray` of the same shape (or a scalar).
+    
+    Complexity
+    ----------
+    For a series of degree $n$ and $m$ points there will be
+    $\mathcal{O}(nm)$ array element operations.
+    
+    Notes
+    -----
+    With $\alpha_k=\sqrt{\frac{2}{k+1}}$ and $\beta_k=\sqrt{\frac{k}{k+1}}$
+    
+    $$
+        b_k = c_k + \alpha_kxb_{k+1} - \beta_{k+1}b_{k+2} \qquad \sum_{k=0}^nc_k\psi_k(x) = b_0\psi_0(x).
+    $$
+    
+    The $b_k$ grow like $e^{\frac{x^2}{2}}$, so they are rescaled like in
+    [`hermfunval_recurrence`][poly.hermite.hermfunval_recurrence] and the
+    scale is only applied together with $\psi_0(x)$ at the end.
+    
+    See also
+    --------
+    - for any implementation: [`hermfunval`][poly.hermite.hermfunval]
+    - other implementations: [`hermfunval_recurrence`][poly.hermite.hermfunval_recurrence]
+    
+    References
+    ----------
+    - [Wikipedia - Clenshaw algorithm](https://en.wikipedia.org/wiki/Clenshaw_algorithm)
+    """
+    c, x = tuple(c), np.asarray(x)
+    dtype = np.result_type(x, *c, float)
+    a, b = np.zeros(x.shape, dtype), np.zeros(x.shape, dtype)
+    s, f = np.zeros(x.shape), np.ones(x.shape)
+    for k in range(len(c)-1, -1, -1):
+        a, b = c[k]*f + sqrt(2/(k+1)) * x * a - sqrt((k+1)/(k+2)) * b, a
+        big = np.abs(a) > 2.0**300
+        if np.any(big):
+            a, b = np.where(big, a * 2.0**-300, a), np.where(big, b * 2.0**-300, b)
+            s = np.where(big, s + 300*log(2), s)
+            f = np.exp(-s)
+    return (a * np.exp(s + np.log(pi)/-4 - x**2/2))[()]
+
+def hermfunvals(x):
+    r"""Yield the values of the orthonormal Hermite functions evaluated at point `x`.
+    
+    $$
+        (\psi_n(x))_{n\in\mathbb{N}_0} = (\psi_0(x), \psi_1(x), \psi_2(x), \dots)
+    $$
+    
+    Uses the orthonormal three-term recurrence with a logarithmic scale
+    like [`hermfunval_recurrence`][poly.hermite.hermfunval_recurrence] on
+    `float`s.
+    
+    See also
+    --------
+    - for many points: [`hermfunvander`][poly.hermite.hermfunvander]
+    - for Hermite polynomials: [`hermvals`][poly.hermite.hermvals]
+    """
+    for _, u, s, _ in _hermfunrecurrence(np.asarray(x, dtype=float)):
+        yield float(u * np.exp(s))
+
+def hermfunvander(x, n):
+    r"""Return the values of the orthonormal Hermite functions up to degree `n` evaluated at points `x`.
+    
+    $$
+        V_{ik} = \psi_k(x_i) \qquad k=0, \dots, n
+    $$
+    
+    Uses the orthonormal three-term recurrence with a logarithmic scale
+    like [`hermfunval_recurrence`][poly.hermite.hermfunval_recurrence] on
+    all points at once.
+    
+    Returns a `numpy.ndarray` of shape `x.shape + (n+1,)`, so a series is
+    evaluated at all points by `hermfunvander(x, n) @ c`.
+    
+    Complexity
+    ----------
+    For $m$ points there will be $\mathcal{O}(nm)$ array element operations.
+    
+    See also
+    --------
+    - for a single point: [`hermfunvals`][poly.hermite.hermfunvals]
+    - for a single series: [`hermfunval`][poly.hermite.hermfunval]
+    - for Hermite polynomials: [`hermvander`][poly.hermite.hermvander]
+    """
+    x = np.asarray(x, dtype=float)
+    return _hermfunvander(x.ravel(), n, 1/2).reshape(x.shape + (n+1,))
+
+def _hermfunvander(x, n, a):
+    r"""Return $\frac{H_k(x_i)e^{-ax_i^2}}{\sqrt{2^kk!\sqrt{\pi}}}$ for $k\le n$ by the orthonormal recurrence."""
+    V = np.empty((x.size, n+1))
+    for k, (_, u, s, _) in zip(range(n+1), _hermfunrecurrence(x, a)):
+        V[:, k] = u * np.exp(s)
+    return V
+
+def _hermfunrecurrence(x, a=1/2):
+    r"""Yield $\psi_{k-1}(x)e^{(\frac{1}{2}-a)x^2-s}$, $\psi_k(x)e^{(\frac{1}{2}-a)x^2-s}$, the logarithmic scale $s$ & the mask of the rescaled points (or `None`) for $k=0, 1, \dots$."""
+    #recurrence on unscaled values with a running logarithmic scale to avoid underflow of exp(-a*x**2)
+    s = np.log(pi)/-4 - a*x**2
+    u0, u1 = np.zeros_like(s), np.ones_like(s)
+    yield u0, u1, s, None
+    for k in count():
+        u0, u1 = u1, sqrt(2/(k+1)) * x * u1 - sqrt(k/(k+1)) * u0
+        big = np.abs(u1) > 2.0**300
+        if not np.any(big):
+            yield u0, u1, s, None
+            continue
+        u0, u1 = np.where(big, u0 * 2.0**-300, u0), np.where(big, u1 * 2.0**-300, u1)
+        s = np.where(big, s + 300*log(2), s)
+        yield u0, u1, s, big
+
+def _hermlognorm(n):
+    r"""Return $\log\sqrt{2^kk!\sqrt{\pi}}$ for $k\le n$."""
+    k = np.arange(n+1)
+    return (k*np.log(2) + np.concatenate(([0], np.cumsum(np.log(k[1:])))) + np.log(np.pi)/2) / 2
+
+def _hermtofun(h):
+    """Return the coefficients of $h(x)e^{-x^2/2}$ in the orthonormal Hermite functions."""
+    with np.errstate(divide='ignore'):
+        return np.sign(h) * np.exp(np.log(np.abs(h)) + _hermlognorm(h.size-1))
+
+def _hermfromfun(c):
+    """Return the Hermite coefficients from coefficients in the orthonormal Hermite functions."""
+    with np.errstate(divide='ignore'):
+        return np.sign(c) * np.exp(np.log(np.abs(c)) - _hermlognorm(c.size-1))
@@ -0,0 +1,291 @@
+from math import sqrt, pi, prod
+from operator import mul
+from itertools import accumulate, count, islice
+from .functions import _hermfunvander, _hermtofun, _hermfromfun
+from .quadrature import _hermquadrature
+from vector import vecadd, vecsub, vecmul, vechadamard, vecdot, vecabs, vecabsq, vecrandn
+import numpy as np
+
+
+
+__all__ = ('herm2hermo', 'hermo2herm',
+           'hermoadd', 'hermosub', 'hermoscalarmul', 'hermomul', 'hermoder',
+           'hermoabs', 'hermoabsq', 'hermodot', 'hermoval', 'hermorandn')
+
+
+
+def herm2hermo(h):
+    r"""Return the coefficients of a Hermite polynomial series in the orthonormal Hermite polynomials.
+    
+    $$
+        \tilde{h}_k = \sqrt{\sqrt{\pi}2^kk!}h_k \qquad \sum_k\tilde{h}_k\tilde{H}_k(x) = \sum_kh_kH_k(x) \qquad \tilde{H}_k(x) = \frac{H_k(x)}{\sqrt{\sqrt{\pi}2^kk!}}
+    $$
+    
+    In the orthonormal scaling the inner product of
+    [`hermdot`][poly.hermite.hermdot] is the plain dot product
+    [`hermodot`][poly.hermite.hermodot] and the coefficients of
+    well-behaved functions stay of order one, where $h_k$ decay like
+    $\frac{1}{\sqrt{2^kk!}}$ and leave the floating point range at degrees
+    of a few hundred.
+    
+    Returns a `tuple` of `float`s.
+    
+    Notes
+    -----
+    The factors are calculated as logarithms, so they don't overflow like
+    $2^kk!$ as a `float` beyond degree 150.
+    
+    See also
+    --------
+    - inverse: [`hermo2herm`][poly.hermite.hermo2herm]
+    - for the normalisation factors: [`hermweights`][poly.hermite.hermweights]
+    """
+    return tuple(_hermtofun(np.asarray(tuple(h), dtype=float)).tolist())
+
+def hermo2herm(h):
+    r"""Return the coefficients of an orthonormal Hermite polynomial series in the Hermite polynomials.
+    
+    $$
+        h_k = \frac{\tilde{h}_k}{\sqrt{\sqrt{\pi}2^kk!}}
+    $$
+    
+    Returns a `tuple` of `float`s.
+    
+    See also
+    --------
+    - inverse: [`herm2hermo`][poly.hermite.herm2hermo]
+    """
+    return tuple(_hermfromfun(np.asarray(tuple(h), dtype=float)).tolist())
+
+def hermoadd(*hs):
+    r"""Return the sum of orthonormal Hermite polynomial series.
+    
+    $$
+        \tilde{h}_0 + \tilde{h}_1 + \cdots
+    $$
+    
+    The scaling is linear, so this is the same as
+    [`hermadd`][poly.hermite.hermadd].
+    
+    See also
+    --------
+    - wraps: [`vector.vecadd`](https://goessl.github.io/vector/functional/#vector.functional.vector_space.vecadd)
+    """
+    return vecadd(*hs)
+
+def hermosub(g, h):
+    r"""Return the difference of two orthonormal Hermite polynomial series.
+    
+    $$
+        \tilde{g} - \tilde{h}
+    $$
+    
+    See also
+    --------
+    - wraps: [`vector.vecsub`](https://goessl.github.io/vector/functional/#vector.functional.vector_space.vecsub)
+    """
+    return vecsub(g, h)
+
+def hermoscalarmul(a, h):
+    r"""Return the product of a scalar and an orthonormal Hermite polynomial series.
+    
+    $$
+        a\tilde{h}
+    $$
+    
+    See also
+    --------
+    - wraps: [`vector.vecmul`](https://goessl.github.io/vector/functional/#vector.functional.vector_space.vecmul)
+    """
+    return vecmul(a, h)
+
+def hermomul(g, h):
+    r"""Return the product of two orthonormal Hermite polynomial series.
+    
+    $$
+        \tilde{g}\tilde{h}
+    $$
+    
+    Uses pseudo-spectral multiplication with floats like
+    [`hermmul_quadrature`][poly.hermite.hermmul_quadrature], but without
+    the conversions from and to the Hermite polynomial scaling.
+    
+    Returns a `tuple` of `float`s.
+    
+    Complexity
+    ----------
+    For two orthonormal Hermite polynomial series of degrees $n$ & $m$
+    there will be $\mathcal{O}\left((n+m)^2\right)$ floating point
+    operations in `numpy` matrix-vector products (plus
+    $\mathcal{O}\left((n+m)^2\right)$ for the basis matrix if not cached).
+    
+    Notes
+    -----
+    The coefficients of the orthonormal Hermite polynomials are the
+    coefficients of the orthonormal Hermite functions $\psi_k$ of
+    $g(x)e^{-\frac{x^2}{2}}$, so with the $N=n+m+1$ Gauss-Hermite nodes
+    $x_i$ and scaled weights $\Lambda_i=w_ie^{x_i^2}$
+    
+    $$
+        (\tilde{g}\tilde{h})_k = \sum_{i=1}^N\Lambda_i\left(\tilde{g}(x_i)e^{-\frac{x_i^2}{4}}\right)\left(\tilde{h}(x_i)e^{-\frac{x_i^2}{4}}\right)\psi_k(x_i).
+    $$
+    
+    See also
+    --------
+    - in Hermite polynomial scaling: [`hermmul_quadrature`][poly.hermite.hermmul_quadrature]
+    - nodes & weights: [`hermgauss`][poly.hermite.hermgauss]
+    
+    References
+    ----------
+    - [Wikipedia - Gauss–Hermite quadrature](https://en.wikipedia.org/wiki/Gauss%E2%80%93Hermite_quadrature)
+    """
+    g, h = np.asarray(tuple(g), dtype=float), np.asarray(tuple(h), dtype=float)
+    if not g.size or not h.size:
+        return () #hermzero
+    x, W, Psi = _hermquadrature(g.size + h.size - 1)
+    G = _hermfunvander(x, g.size-1, 1/4) @ g
+    H = _hermfunvander(x, h.size-1, 1/4) @ h
+    return tuple((Psi.T @ (W * G * H)).tolist())
+
+def hermoder(h, k=1):
+    r"""Return the `k`-th derivative of orthonormal Hermite polynomial series `h`.
+    
+    $$
+        \tilde{h}^{(k)}
+    $$
+    
+    Notes
+    -----
+    From $H_n'(x)=2nH_{n-1}(x)$ follows
+    $\tilde{H}_n'(x)=\sqrt{2n}\tilde{H}_{n-1}(x)$ and therefore
+    
+    $$
+        \frac{d^k}{dx^k}\tilde{h}(x) = \sum_{l=0}^{n-k}\sqrt{2^k{}_{l+k}P_k}\,\tilde{h}_{l+k}\tilde{H}_l(x).
+    $$
+    
+    The factors are accumulated as a running `float` product
+    $\sqrt{2^k{}_{l+k}P_k}=\sqrt{2^k{}_{l+k-1}P_k}\sqrt{\frac{l+k}{l}}$, so
+    no big integer has to be converted to a `float`.
+    
+    See also
+    --------
+    - in Hermite polynomial scaling: [`hermder`][poly.hermite.hermder]
+    """
+    f = prod(sqrt(2*j) for j in range(1, k+1))
+    return vechadamard(accumulate((sqrt((l+k)/l) for l in count(1)), mul, initial=f), islice(h, k, None))
+
+def hermoabs(h, conjugate=False, zero=0):
+    r"""Return the norm of an orthonormal Hermite polynomial series.
+    
+    $$
+        ||\tilde{h}||_H = \sqrt{\sum_k\tilde{h}^{(*)}_k\tilde{h}_k}
+    $$
+    
+    See also
+    --------
+    - in Hermite polynomial scaling: [`hermabs`][poly.hermite.hermabs]
+    - wraps: [`vector.vecabs`](https://goessl.github.io/vector/functional/#vector.functional.hilbert_space.vecabs)
+    """
+    return vecabs(h, conjugate=conjugate, zero=zero)
+
+def hermoabsq(h, conjugate=False, zero=0):
+    r"""Return the norm squared of an orthonormal Hermite polynomial series.
+    
+    $$
+        ||\tilde{h}||_H^2 = \sum_k\tilde{h}^{(*)}_k\tilde{h}_k
+    $$
+    
+    Complexity
+    ----------
+    For an orthonormal Hermite polynomial series of degree $n$ there will be
+    
+    - $n+1$ scalar conjugations (`conjugate`) (if selected),
+    - $n+1$ scalar multiplications (`mul`) &
+    - $\begin{cases}n&n\ge1\\0&n\le1\end{cases}$ scalar additions (`add`).
+    
+    See also
+    --------
+    - in Hermite polynomial scaling: [`hermabsq`][poly.hermite.hermabsq]
+    - wraps: [`vector.vecabsq`](https://goessl.github.io/vector/functional/#vector.functional.hilbert_space.vecabsq)
+    """
+    return vecabsq(h, conjugate=conjugate, zero=zero)
+
+def hermodot(g, h, conjugate=False, zero=0):
+    r"""Return the inner product of two orthonormal Hermite polynomial series.
+    
+    $$
+        \left<\tilde{g}\mid\tilde{h}\right>_H = \int_\mathbb{R}\tilde{g}^{(*)}(x)\tilde{h}(x)e^{-x^2}\,\mathrm{d}x = \sum_k\tilde{g}^{(*)}_k\tilde{h}_k
+    $$
+    
+    Complexity
+    ----------
+    For two orthonormal Hermite polynomial series of degrees $n$ & $m$ there will be
+    
+    - $\min\{n, m\}+1$ scalar conjugations (`conjugate`) (if selected),
+    - $\min\{n, m\}+1$ scalar multiplications (`mul`) &
+    - $\begin{cases}\min\{n, m\}&n\ge0\land m\ge0\\0&n<0\lor m<0\end{cases}$ scalar additions (`add`).
+    
+    See also
+    --------
+    - in Hermite polynomial scaling: [`hermdot`][poly.hermite.hermdot]
+    - wraps: [`vector.vecdot`](https://goessl.github.io/vector/functional/#vector.functional.hilbert_space.vecdot)
+    """
+    return vecdot(g, h, conjugate=conjugate, zero=zero)
+
+def hermoval(h, x):
+    r"""Return the value of an orthonormal Hermite polynomial series evaluated at points `x`.
+    
+    $$
+        \sum_{k=0}^n\tilde{h}_k\tilde{H}_k(x)
+    $$
+    
+    Uses the Clenshaw algorithm on the orthonormal three-term recurrence
+    
+    $$
+        \tilde{H}_{k+1}(x) = \sqrt{\frac{2}{k+1}}x\tilde{H}_k(x) - \sqrt{\frac{k}{k+1}}\tilde{H}_{k-1}(x) \qquad \tilde{H}_0(x) = \pi^{-\frac{1}{4}}
+    $$
+    
+    on all points at once.
+    
+    `x` may be a scalar or an array of any shape, the result is a
+    `numpy.ndarray` of the same shape (or a scalar).
+    
+    Complexity
+    ----------
+    For a series of degree $n$ and $m$ points there will be
+    $\mathcal{O}(nm)$ array element operations.
+    
+    See also
+    --------
+    - in Hermite polynomial scaling: [`hermval_vectorised`][poly.hermite.hermval_vectorised]
+    - with the Gaussian: [`hermfunval_clenshaw`][poly.hermite.hermfunval_clenshaw]
+    
+    References
+    ----------
+    - [Wikipedia - Clenshaw algorithm](https://en.wikipedia.org/wiki/Clenshaw_algorithm)
+    """
+    h, x = tuple(h), np.asarray(x)
+    dtype = np.result_type(x, *h, float)
+    a, b = np.zeros(x.shape, dtype), np.zeros(x.shape, dtype)
+    for k in range(len(h)-1, -1, -1):
+        a, b = h[k] + sqrt(2/(k+1)) * x * a - sqrt((k+1)/(k+2)) * b, a
+    return (a * pi**-0.25)[()]
+
+def hermorandn(n, normed=True, mu=0, sigma=1):
+    r"""Return a random orthonormal Hermite polynomial series of degree `n`.
+    
+    $$
+        \sum_{k=0}^na_k\tilde{H}_k(x) \quad a_k\sim\mathcal{N}(\mu, \sigma)
+    $$
+    
+    The coefficients are sampled from a normal distribution.
+    
+    Normed with respect to the Hermite polynomial norm $\int_\mathbb{R}h^2(x)e^{-x^2}\,\mathrm{d}x$,
+    which is the plain euclidean norm in the orthonormal scaling.
+    
+    See also
+    --------
+    - in Hermite polynomial scaling: [`hermrandn`][poly.hermite.hermrandn]
+    - wraps: [`vector.vecrandn`](https://goessl.github.io/vector/functional/#vector.functional.creation.vecrandn)
+    """
+    return vecrandn(n+1, normed=normed, mu=mu, sigma=sigma)
@@ -0,0 +1,209 @@
+from math import pi, sqrt
+from functools import lru_cache
+from itertools import islice
+from .functions import _hermfunvander, _hermfunrecurrence, _hermfromfun
+import numpy as np
+
+
+
+__all__ = ('hermgauss', 'hermfit')
+
+
+
+@lru_cache(maxsize=16)
+def hermgauss(n, scaled=False):
+    r"""Return the Gauss-Hermite quadrature nodes and weights for `n` nodes.
+    
+    $$
+        \int_{-\infty}^\infty f(x)e^{-x^2}\,\mathrm{d}x \approx \sum_{i=1}^nw_if(x_i)
+    $$
+    
+    The rule is exact for polynomials $f$ of degree $2n-1$ or less, so
+    for the weight $e^{-x^2}$ of [`hermdot`][poly.hermite.hermdot].
+    
+    If `scaled`, the weights $w_ie^{x_i^2}$ are returned instead, which
+    don't underflow for many nodes and integrate $f(x)$ instead of
+    $f(x)e^{-x^2}$ for $f(x)e^{x^2}$ a polynomial of degree $2n-1$ or
+    less.
+    
+    Returns two read-only `numpy.ndarray`s `x, w` of ascending nodes and
+    weights. Results are cached for the 16 most recently used arguments.
+    
+    Complexity
+    ----------
+    For $n\leq100$ nodes there will be one symmetric tridiagonal eigenvalue
+    problem of size $n$. For more nodes there will be a constant number of
+    Newton iterations with $\mathcal{O}(n)$ array element operations per
+    node, so $\mathcal{O}(n^2)$ in vectorised `numpy` operations and no
+    $\mathcal{O}(n^3)$ eigen-solve.
+    
+    Notes
+    -----
+    For $n\leq100$ the initial nodes are the eigenvalues of the Jacobi
+    matrix of the orthonormal recurrence (Golub-Welsch). For more nodes
+    the initial nodes are asymptotic approximations, Tricomi's in the bulk
+    and Airy-type at the edge. In both cases the nodes are refined by
+    Newton's method on the orthonormal Hermite function
+    $\psi_n(x_i)=0$ with $\psi_n'(x_i)=\sqrt{2n}\psi_{n-1}(x_i)$, and the
+    weights are the Christoffel numbers
+    
+    $$
+        w_ie^{x_i^2} = \frac{1}{\sum_{k<n}\psi_k^2(x_i)} = \frac{1}{n\psi_{n-1}^2(x_i)}.
+    $$
+    
+    All values are calculated by the three-term recurrence with a
+    logarithmic scale like
+    [`hermfunval_recurrence`][poly.hermite.hermfunval_recurrence], so
+    nothing over- or underflows.
+    
+    See also
+    --------
+    - for Hermite functions: [`hermfunvander`][poly.hermite.hermfunvander]
+    
+    References
+    ----------
+    - [Wikipedia - Gauss–Hermite quadrature](https://en.wikipedia.org/wiki/Gauss%E2%80%93Hermite_quadrature)
+    - Gene H. Golub & John H. Welsch: Calculation of Gauss Quadrature Rules. [10.1090/S0025-5718-69-99647-1](https://doi.org/10.1090/S0025-5718-69-99647-1)
+    - Alex Townsend, Thomas Trogdon & Sheehan Olver: Fast computation of Gauss quadrature nodes and weights on the whole real line. [10.1093/imanum/drv002](https://doi.org/10.1093/imanum/drv002)
+    - `numpy` equivalent: [`numpy.polynomial.hermite.hermgauss`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.hermite.hermgauss.html)
+    """
+    if n < 1:
+        raise ValueError('At least one node required')
+    if n <= 100:
+        x = np.linalg.eigvalsh(np.diag(np.sqrt(np.arange(1, n)/2), 1), UPLO='U')
+        x = x[n//2:] #nonnegative half, the rule is symmetric
+        iterations = 1
+    else:
+        x = _hermgauss_asymptotic(n)
+        iterations = 3
+    for _ in range(iterations):
+        u, v, _ = _hermfunlast(x, n)
+        x = x - u / (sqrt(2*n) * v)
+    u, v, s = _hermfunlast(x, n)
+    w = np.exp(-2*s if scaled else -2*s - x**2) / (n * v**2)
+    #mirror the nonnegative half
+    if n % 2:
+        x[0] = 0
+        x, w = np.concatenate((-x[:0:-1], x)), np.concatenate((w[:0:-1], w))
+    else:
+        x, w = np.concatenate((-x[::-1], x)), np.concatenate((w[::-1], w))
+    x.flags.writeable = w.flags.writeable = False
+    return x, w
+
+def hermfit(f, n, N=None):
+    r"""Return the projection of a function onto the Hermite polynomials up to degree `n`.
+    
+    $$
+        h_k = \frac{\left<f\mid H_k\right>_H}{\sqrt{\pi}2^kk!} = \frac{1}{\sqrt{\pi}2^kk!}\int_\mathbb{R}f(x)H_k(x)e^{-x^2}\,\mathrm{d}x \qquad k=0, \dots, n
+    $$
+    
+    The integrals are calculated by Gauss-Hermite quadrature on `N`
+    (default `n+1`) nodes, the result is the best approximation of $f$ in
+    the norm of [`hermdot`][poly.hermite.hermdot].
+    
+    `f` is either a callable, that is called once with the `numpy.ndarray`
+    of all nodes (scalar results, e.g. of constant functions, are
+    broadcast), or the samples of the function at the nodes
+    `hermgauss(N)[0]`.
+    
+    Returns a `tuple` of `float`s, or of `complex`es for complex values of `f`.
+    
+    Complexity
+    ----------
+    There will be one matrix-vector product of size $(n+1)\times N$ in
+    `numpy` (plus $\mathcal{O}(nN)$ for the projection matrix if not
+    cached) and $N$ evaluations of `f`.
+    
+    Notes
+    -----
+    The rule is exact if $f$ is a polynomial of degree $2N-1-n$ or less,
+    especially for polynomials of degree $n$ or less with the default
+    $N=n+1$. All values are calculated in the orthonormal Hermite functions
+    $\psi_k$ with the scaled weights of
+    [`hermgauss`][poly.hermite.hermgauss], like
+    
+    $$
+        h_k = \frac{1}{\sqrt{\sqrt{\pi}2^kk!}}\sum_{i=1}^Nw_ie^{x_i^2}\left(f(x_i)e^{-\frac{x_i^2}{2}}\right)\psi_k(x_i),
+    $$
+    
+    so neither $H_k(x_i)$ nor the weights over- or underflow. The
+    projection matrix is cached for the 8 most recently used `n, N`.
+    
+    See also
+    --------
+    - nodes & weights: [`hermgauss`][poly.hermite.hermgauss]
+    - inner product: [`hermdot`][poly.hermite.hermdot]
+    - for least squares fits on arbitrary points: [`PolyFitter`][poly.standard.PolyFitter]
+    with [`hermvander`][poly.hermite.hermvander]
+    
+    References
+    ----------
+    - [Wikipedia - Gauss–Hermite quadrature](https://en.wikipedia.org/wiki/Gauss%E2%80%93Hermite_quadrature)
+    - [Wikipedia - Hermite polynomials - Completeness relation](https://en.wikipedia.org/wiki/Hermite_polynomials#Completeness_relation)
+    """
+    N = n+1 if N is None else N
+    if N < n+1:
+        raise ValueError('At least n+1 nodes required')
+    M = _hermfitmatrix(n, N)
+    if callable(f):
+        y = np.asarray(f(hermgauss(N)[0]))
+        y = np.broadcast_to(y.astype(np.result_type(y, float)), (N,))
+    else:
+        y = np.asarray(f)
+    if y.shape != (N,):
+        raise ValueError('One sample per node required')
+    c = M @ y
+    if np.iscomplexobj(c):
+        return tuple((_hermfromfun(c.real) + 1j*_hermfromfun(c.imag)).tolist())
+    return tuple(_hermfromfun(c).tolist())
+
+@lru_cache(maxsize=8)
+def _hermfitmatrix(n, N):
+    r"""Return the read-only projection matrix $w_ie^{\frac{x_i^2}{2}}\psi_k(x_i)$ of shape $(n+1)\times N$."""
+    x, w = hermgauss(N, scaled=True)
+    M = (_hermfunvander(x, n, 1/2) * (w * np.exp(-x**2/2))[:, np.newaxis]).T
+    M.flags.writeable = False
+    return M
+
+@lru_cache(maxsize=8)
+def _hermquadrature(N):
+    r"""Return the Gauss-Hermite nodes $x_i$, scaled weights $\Lambda_i$ & Hermite functions $\psi_k(x_i)$ for $N$ nodes."""
+    x, W = hermgauss(N, scaled=True)
+    Psi = _hermfunvander(x, N-1, 1/2)
+    Psi.flags.writeable = False
+    return x, W, Psi
+
+def _hermfunlast(x, n):
+    r"""Return $\psi_n(x)e^{-s}, \psi_{n-1}(x)e^{-s}$ & the logarithmic scale $s$."""
+    u0, u1, s, _ = next(islice(_hermfunrecurrence(x), n, None))
+    return u1, u0, s
+
+def _hermgauss_asymptotic(n):
+    """Return asymptotic approximations of the nonnegative zeros of $H_n$ in ascending order."""
+    #Tricomi in the bulk and Airy-type at the edge (after Townsend, Trogdon & Olver)
+    m, a = ((n-1)//2, 1/2) if n % 2 else (n//2, -1/2)
+    nu = 4*m + 2*a + 2
+    k = np.arange(1, m+1)
+    #Tricomi: solve t - sin(t) = rhs
+    rhs = (4*m - 4*k + 3) / nu * pi
+    t = np.full(m, pi/2)
+    for _ in range(7):
+        t -= (t - np.sin(t) - rhs) / (1 - np.cos(t))
+    c = np.cos(t/2)**2
+    x_tricomi = np.sqrt(nu*c - (5/(4*(1-c)**2) - 1/(1-c) - 1 + 3*a**2)/3/nu)
+    #Airy: zeros of Ai asymptotically, the first ten exact
+    z = 3/8*pi*(4*k - 1)
+    ai = -z**(2/3) * (1 + 5/48*z**-2 - 5/36*z**-4 + 77125/82944*z**-6
+                      - 108056875/6967296*z**-8 + 162375596875/334430208*z**-10)
+    ai[:10] = (-2.338107410459767, -4.087949444130970, -5.520559828095551,
+               -6.786708090071759, -7.944133587120853, -9.022650853340981,
+               -10.04017434155809, -11.00852430373326, -11.93601556323626,
+               -12.82877675286576)
+    x_airy = np.sqrt(np.abs(nu + 2**(2/3)*ai*nu**(1/3) + 2**(4/3)/5*ai**2*nu**(-1/3)
+                            + (11/35 - a**2 - 12/175*ai**3)/nu
+                            + (16/1575*ai + 92/7875*ai**4)*2**(2/3)*nu**(-5/3)
+                            - (15152/3031875*ai**5 + 1088/121275*ai**2)*2**(1/3)*nu**(-7/3)))[::-1]
+    #patch together, Airy for the outermost zeros
+    p = int(0.4985*n + 1e-12)
+    x = np.concatenate((x_tricomi[:p], x_airy[p:]))
+    return np.concatenate(([0.0], x)) if n % 2 else x
@@ -55,3 +55,5 @@ from .evaluation import *
 from .arithmetic import *
 from .calculus import *
 from .conversion import *
+from .roots import *
+from .interpolation import *
@@ -9,7 +9,7 @@ __all__ = ('polypos', 'polyneg',
            'polyscalarmul', 'polyscalartruediv', 'polyscalarfloordiv',
            'polyscalarmod', 'polyscalardivmod',
            'polymul', 'polymul_naive', 'polymul_karatsuba',
-           'polymulx',
+           'polymulx', 'polyinv_series',
            'polypow', 'polypow_naive', 'polypow_binary', 'polypows')
 
 
@@ -315,9 +315,11 @@ def polymul_naive(p, q):
                 r[i+j] += pi * qj
     return tuple(r)
 
+_KARATSUBA_CUTOFF = 32
+
 def _polymul_karatsuba(p, q):
-    if len(p) == 1:
-        return (p[0] * q[0],)
+    if len(p) <= _KARATSUBA_CUTOFF:
+        return polymul_naive(p, q)
     
     m = len(p) // 2
     pl, pu = p[:m], p[m:]
@@ -342,6 +344,10 @@ def polymul_karatsuba(p, q):
     
     Both arguments must be sequences.
     
+    Falls back to [`polymul_naive`][poly.standard.arithmetic.polymul_naive]
+    for blocks of 32 coefficients or less, where the recursion overhead
+    outweighs the saved multiplications.
+    
     TODO: complexity
     
     See also
@@ -387,6 +393,48 @@ def polymulx(p, n=1, zero=0):
     """
     return vecrshift(p, n, zero=zero)
 
+def polyinv_series(p, n, one=1):
+    r"""Return the multiplicative inverse of power series `p` truncated to degree less than `n`.
+    
+    $$
+        \frac{1}{p} \mod x^n
+    $$
+    
+    The constant coefficient $a_0$ must be invertible.
+    
+    Uses Newton iteration $g\leftarrow g(2-pg)$, which doubles the number
+    of correct coefficients in every step, with
+    [`polymul_karatsuba`][poly.standard.polymul_karatsuba] on truncated series.
+    
+    Units $a_0=\pm1$ are their own inverses, so integer series with such a
+    constant coefficient stay integers, otherwise `one/a_0` is used.
+    
+    Complexity
+    ----------
+    About $3$ multiplications of series of length $n$, so
+    $\mathcal{O}\left(n^{\log_23}\right)$ scalar operations.
+    
+    See also
+    --------
+    - used by: [`polyrevert_series`][poly.standard.polyrevert_series]
+    
+    References
+    ----------
+    - [Wikipedia - Formal power series - Multiplicative inverse](https://en.wikipedia.org/wiki/Formal_power_series#Multiplicative_inverse)
+    - [Wikipedia - Division algorithm - Newton–Raphson division](https://en.wikipedia.org/wiki/Division_algorithm#Newton%E2%80%93Raphson_division)
+    """
+    p = tuple(p)[:n]
+    if n <= 0:
+        return ()
+    if not p or not p[0]:
+        raise ValueError('Constant coefficient must be invertible')
+    g, m = (p[0] if p[0] in (one, -one) else one/p[0],), 1
+    while m < n:
+        m = min(2*m, n)
+        e = polymul_karatsuba(p[:m], g)[:m]
+        g = polysub(polyscalarmul(2, g), polymul_karatsuba(g, e)[:m])
+    return g
+
 def polypow(p, n, method='naive'):
     """Return the polynomial `p` raised to the nonnegative `n`-th power.
     
@@ -1,13 +1,20 @@
+from math import factorial, isqrt, lcm
+from fractions import Fraction
 from itertools import chain, count, islice, repeat
-from .arithmetic import polyadd, polyaddc, polyscalarmul, polymul_naive, polypow_naive, polypows
+from .arithmetic import polyadd, polyaddc, polysub, polysubc, polyscalarmul, polyinv_series, polymul_naive, polymul_karatsuba, polymulx, polypow_naive, polypows
 from operationcounter import MISSING, reduce_default, prod_default, sumprod_default
 from vector import veclhadamard
+import numpy as np
 
 
 
-__all__ = ('polyval', 'polyval_naive', 'polyval_iterative', 'polyval_horner', 'polyvals', 'polyvalzero',
-           'polycom', 'polycom_naive', 'polycom_iterative', 'polycom_horner',
-           'polyshift', 'polyscale')
+__all__ = ('polyval', 'polyval_naive', 'polyval_iterative', 'polyval_horner',
+           'polyval_paterson_stockmeyer', 'polyval_rational', 'polyval_mod', 'polyvals', 'polyvalzero', 'PolyGrid',
+           'polyval_unity', 'polyval_geometric', 'polyvalder',
+           'polycom', 'polycom_naive', 'polycom_iterative', 'polycom_horner', 'polycom_divconq',
+           'polycom_brentkung', 'polyrevert_series',
+           'polyshift', 'polyshift_naive', 'polyshift_horner',
+           'polyscale')
 
 
 
@@ -21,16 +28,23 @@ def polyval(p, x, method='horner'):
     Available methods are
     
     - [`naive`][poly.standard.polyval_naive],
-    - [`iterative`][poly.standard.polyval_iterative] &
-    - [`horner`][poly.standard.polyval_horner] (`p` must be reversible).
+    - [`iterative`][poly.standard.polyval_iterative],
+    - [`horner`][poly.standard.polyval_horner] (`p` must be reversible),
+    - [`paterson_stockmeyer`][poly.standard.polyval_paterson_stockmeyer]
+    (for expensive arguments like matrices) &
+    - [`rational`][poly.standard.polyval_rational]
+    (for exact `int`/`Fraction` coefficients and arguments).
     
     See also
     --------
     - implementations: [`polyval_naive`][poly.standard.polyval_naive],
     [`polyval_iterative`][poly.standard.polyval_iterative],
-    [`polyval_horner`][poly.standard.polyval_horner]
+    [`polyval_horner`][poly.standard.polyval_horner],
+    [`polyval_paterson_stockmeyer`][poly.standard.polyval_paterson_stockmeyer],
+    [`polyval_rational`][poly.standard.polyval_rational]
     - for consecutive monomials: [`polyvals`][poly.standard.polyvals]
     - for $x=0$: [`polyvalzero`][poly.standard.polyvalzero]
+    - with derivatives: [`polyvalder`][poly.standard.polyvalder]
     - for polynomial arguments: [`polycom`][poly.standard.polycom]
     
     References
@@ -44,6 +58,10 @@ def polyval(p, x, method='horner'):
             return polyval_iterative(p, x)
         case 'horner':
             return polyval_horner(p, x)
+        case 'paterson_stockmeyer':
+            return polyval_paterson_stockmeyer(p, x)
+        case 'rational':
+            return polyval_rational(p, x)
         case _:
             raise ValueError('Invalid method')
 
@@ -131,6 +149,7 @@ def polyval_horner(p, x):
     - other implementations:
     [`polyval_naive`][poly.standard.polyval_naive],
     [`polyval_iterative`][poly.standard.polyval_iterative]
+    - for exact rational arguments: [`polyval_rational`][poly.standard.polyval_rational]
     - for polynomial arguments: [`polycom_horner`][poly.standard.polycom_horner]
     
     References
@@ -141,6 +160,149 @@ def polyval_horner(p, x):
     an = next(p, type(x)(0))
     return reduce_default(lambda a, pi: a*x+pi, p, initial=an, default=MISSING)
 
+def polyval_paterson_stockmeyer(p, x, one=1):
+    r"""Return the value of polynomial `p` evaluated at point `x`.
+    
+    $$
+        p(x)
+    $$
+    
+    Uses the Paterson–Stockmeyer method (baby-step giant-step).
+    
+    Worthwhile if multiplications of arguments are much more expensive than
+    multiplications of scalar coefficients with arguments, e.g. for
+    matrices with scalar coefficients. Every block starts from `p[j]*one`,
+    so for matrix arguments `one` should be the identity matrix.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ and $k=\left\lfloor\sqrt{n}\right\rfloor+1$
+    there will be
+    
+    - $\begin{cases}k-1+\left\lceil\frac{n+1}{k}\right\rceil-1&n\ge0\\0&n<0\end{cases}$ multiplications of arguments (`mul`),
+    - $\begin{cases}n+1-\left\lceil\frac{n+1}{k}\right\rceil&n\ge0\\0&n<0\end{cases}$ multiplications of coefficients with arguments (`rmul`) &
+    - $\begin{cases}n&n\ge0\\0&n<0\end{cases}$ additions (`add`).
+    
+    Notes
+    -----
+    With the powers $x, x^2, \dots, x^k$ (baby steps) every block of $k$
+    coefficients $B_j(x)=\sum_{i=0}^{k-1}a_{jk+i}x^i$ needs only
+    coefficient-argument multiplications. The blocks are then combined by
+    Horner's method in $x^k$ (giant steps):
+    
+    $$
+        p(x) = \left(\cdots\left(B_J(x)x^k+B_{J-1}(x)\right)x^k+\cdots\right)x^k+B_0(x)
+    $$
+    
+    In total about $2\sqrt{n}$ instead of $n$ multiplications of arguments.
+    
+    See also
+    --------
+    - for any implementation: [`polyval`][poly.standard.polyval]
+    - other implementations:
+    [`polyval_naive`][poly.standard.polyval_naive],
+    [`polyval_iterative`][poly.standard.polyval_iterative],
+    [`polyval_horner`][poly.standard.polyval_horner]
+    - for polynomial arguments: [`polycom_brentkung`][poly.standard.polycom_brentkung]
+    
+    References
+    ----------
+    - Michael S. Paterson & Larry J. Stockmeyer: On the Number of Nonscalar Multiplications Necessary to Evaluate Polynomials. [10.1137/0202007](https://doi.org/10.1137/0202007)
+    - [Wikipedia - Polynomial evaluation - Evaluation with preprocessing](https://en.wikipedia.org/wiki/Polynomial_evaluation#Evaluation_with_preprocessing)
+    """
+    p = tuple(p)
+    if not p:
+        return type(x)(0)
+    k = isqrt(len(p)-1) + 1
+    xs = [x] #xs[i] = x^(i+1)
+    for _ in range(k-1):
+        xs.append(xs[-1] * x)
+    blocks = tuple(sumprod_default(p[j+1:j+k], xs, initial=p[j]*one, default=MISSING)
+                   for j in reversed(range(0, len(p), k)))
+    return reduce_default(lambda a, b: a*xs[-1]+b, blocks, default=MISSING)
+
+def polyval_rational(p, x):
+    r"""Return the exact value of rational polynomial `p` evaluated at rational point `x`.
+    
+    $$
+        p\left(\frac{u}{v}\right) = \frac{1}{v^n}\sum_{k=0}^na_ku^kv^{n-k}
+    $$
+    
+    Coefficients and `x` may be `int`s or `Fraction`s (anything with
+    `numerator` and `denominator`). Uses Horner's method on integers only
+    and normalises a single `Fraction` at the end instead of one per step.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be
+    
+    - $n$ integer additions (`add`),
+    - $4n+1$ integer multiplications (`mul`),
+    - $n+1$ integer divisions (`floordiv`) &
+    - one `Fraction` normalisation (`gcd`).
+    
+    Notes
+    -----
+    Fractional coefficients are brought to their least common denominator
+    $D$ first, so the numerator is $\sum_kDa_ku^kv^{n-k}$ and the denominator
+    is $Dv^n$.
+    
+    See also
+    --------
+    - for any implementation: [`polyval`][poly.standard.polyval]
+    - other implementations: [`polyval_horner`][poly.standard.polyval_horner]
+    - for Hermite series: [`hermval_rational`][poly.hermite.hermval_rational]
+    
+    References
+    ----------
+    - [Wikipedia - Horner's method](https://en.wikipedia.org/wiki/Horner%27s_method)
+    """
+    p = tuple(p)
+    if not p:
+        return Fraction(0)
+    D = lcm(*(a.denominator for a in p))
+    u, v = x.numerator, x.denominator
+    s, vk = p[-1].numerator * (D // p[-1].denominator), 1
+    for a in reversed(p[:-1]):
+        vk *= v
+        s = s*u + a.numerator * (D // a.denominator) * vk
+    return Fraction(s, D*vk)
+
+def polyval_mod(p, x, m):
+    r"""Return the value of integer polynomial `p` evaluated at point `x` modulo `m`.
+    
+    $$
+        p(x) \bmod m
+    $$
+    
+    Uses Horner's method and reduces modulo $m$ at every step, so the
+    intermediate values never exceed $m^2$.
+    
+    `p` must be reversible.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be
+    
+    - $n$ scalar additions (`add`),
+    - $n$ scalar multiplications (`mul`) &
+    - $n+1$ scalar modulos (`mod`).
+    
+    See also
+    --------
+    - for any implementation: [`polyval`][poly.standard.polyval]
+    - used by: [`polyeq_probabilistic`][poly.standard.polyeq_probabilistic]
+    - for Hermite series: [`hermval_mod`][poly.hermite.hermval_mod]
+    
+    References
+    ----------
+    - [Wikipedia - Horner's method](https://en.wikipedia.org/wiki/Horner%27s_method)
+    """
+    y = 0
+    for a in reversed(p):
+        y = (y*x + a) % m
+    return y
+
 def polyvals(x, start=0):
     r"""Yield the powers of the value `x`.
     
@@ -181,6 +343,246 @@ def polyvalzero(p, zero=0):
     """
     return next(iter(p), zero)
 
+class PolyGrid:
+    r"""Fixed grid of points for the repeated evaluation of polynomials.
+    
+    $$
+        \left(p(x_i)\right)_i = V\vec{p} \qquad V_{ik} = x_i^k
+    $$
+    
+    The powers table (Vandermonde matrix) $V$ is computed once and cached,
+    so evaluation of one or many polynomials is a single matrix product.
+    The table grows on demand to the highest degree evaluated so far.
+    
+    `maxbytes` caps the memory of the cached table. Beyond the cap only
+    the cached lower powers are used and the remaining coefficients are
+    evaluated with Horner's method on the whole grid.
+    
+    The points are promoted to at least `float` (complex grids stay
+    complex), so the powers of integer grids don't wrap around silently.
+    Values are returned as `numpy.ndarray`s.
+    
+    Complexity
+    ----------
+    For a grid of $N$ points and a polynomial of degree $n$ there will be
+    
+    - $\mathcal{O}(Nn)$ multiplications to grow the table (only once) &
+    - one matrix-vector product (or matrix-matrix for many polynomials).
+    
+    See also
+    --------
+    - for single points: [`polyval`][poly.standard.polyval]
+    - powers of a single point: [`polyvals`][poly.standard.polyvals]
+    - for roots of unity & geometric progressions: [`polyval_unity`][poly.standard.polyval_unity],
+    [`polyval_geometric`][poly.standard.polyval_geometric]
+    
+    References
+    ----------
+    - `numpy` equivalent: [`numpy.polynomial.polynomial.polyvander`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.polynomial.polyvander.html)
+    """
+    
+    def __init__(self, xs, maxbytes=None):
+        """Create a grid of the points `xs` with at most `maxbytes` of cached powers."""
+        self.xs = np.ravel(xs)
+        self.xs = self.xs.astype(np.result_type(self.xs, float), copy=False)
+        self.maxbytes = maxbytes
+        self.clear()
+    
+    def clear(self):
+        """Evict the cached powers table."""
+        self._V = np.ones((self.xs.size, 1), dtype=self.xs.dtype)
+    
+    def _extend(self, V, n):
+        """Return the powers table `V` extended up to degree `n`."""
+        k = n+1 - V.shape[1]
+        if k <= 0:
+            return V
+        xs = np.repeat(self.xs[:, np.newaxis], k, axis=1)
+        return np.hstack((V, V[:, -1:] * np.cumprod(xs, axis=1)))
+    
+    def _cached(self, n):
+        """Return the cached powers up to degree `n`, less if capped by `maxbytes`."""
+        m = n
+        if self.maxbytes is not None:
+            m = min(m, self.maxbytes // max(self._V.itemsize*self.xs.size, 1) - 1)
+        self._V = self._extend(self._V, m)
+        return self._V[:, :n+1]
+    
+    def vander(self, n):
+        r"""Return the powers table $V_{ik}=x_i^k$ for $k\le n$ of shape `(len(xs), n+1)`."""
+        return self._extend(self._cached(n), n)
+    
+    def __call__(self, p):
+        """Return the values of the polynomial(s) `p` on the grid.
+        
+        `p` is a single coefficient sequence or a two dimensional array of
+        coefficients (one polynomial per row). Returns an array of shape
+        `(len(xs),)` or `(len(p), len(xs))` respectively.
+        """
+        p = np.asarray(p)
+        n = p.shape[-1]
+        if n == 0:
+            return np.zeros(p.shape[:-1]+(self.xs.size,), dtype=self.xs.dtype)
+        V = self._cached(n-1)
+        m = V.shape[1]
+        r = p[..., :m] @ V.T
+        if m < n:
+            h = p[..., -1:]
+            for a in reversed(p[..., m:-1].T):
+                h = h*self.xs + a[..., None]
+            r = r + h * (V[:, -1]*self.xs)
+        return r
+
+def polyval_unity(p, N):
+    r"""Return the values of polynomial `p` at the `N`-th roots of unity.
+    
+    $$
+        \left(p\left(\omega^k\right)\right)_{k=0}^{N-1} \qquad \omega=e^{\frac{2\pi i}{N}}
+    $$
+    
+    The coefficients are folded modulo $N$ (as $\omega^{j+N}=\omega^j$)
+    and evaluated all at once by an inverse FFT.
+    
+    Values are returned as a complex `numpy.ndarray`.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be
+    
+    - $n+1$ additions to fold the coefficients &
+    - one FFT of size $N$, so $\mathcal{O}(N\log N)$ operations.
+    
+    See also
+    --------
+    - for arbitrary geometric progressions: [`polyval_geometric`][poly.standard.polyval_geometric]
+    - for arbitrary grids: [`PolyGrid`][poly.standard.PolyGrid]
+    
+    References
+    ----------
+    - [Wikipedia - Discrete Fourier transform](https://en.wikipedia.org/wiki/Discrete_Fourier_transform)
+    """
+    if N < 1:
+        raise ValueError('At least one root of unity required')
+    a = np.zeros(N, dtype=complex)
+    p = np.asarray(tuple(p), dtype=complex)
+    np.add.at(a, np.arange(p.size) % N, p)
+    return N * np.fft.ifft(a)
+
+def polyval_geometric(p, a, r, m):
+    r"""Return the values of polynomial `p` at `m` points of a geometric progression.
+    
+    $$
+        \left(p\left(ar^k\right)\right)_{k=0}^{m-1}
+    $$
+    
+    Uses Bluestein's chirp-z transform: with $w^2=r$ and
+    $jk=\frac{j^2+k^2-(k-j)^2}{2}$ the values become a convolution
+    
+    $$
+        p\left(ar^k\right) = w^{k^2}\sum_{j=0}^n\left(a_ja^jw^{j^2}\right)w^{-(k-j)^2},
+    $$
+    
+    which is calculated by FFTs.
+    
+    Values are returned as a complex `numpy.ndarray`.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be $\mathcal{O}((n+m)\log(n+m))$
+    operations instead of $\mathcal{O}(nm)$ for $m$ calls of
+    [`polyval_horner`][poly.standard.polyval_horner].
+    
+    Notes
+    -----
+    The chirps $w^{j^2}$ are calculated as $e^{j^2\log w}$. For $|r|=1$
+    they all have unit modulus and the result is as accurate as an FFT.
+    Otherwise their moduli span $|r|^{\pm\frac{(n+m)^2}{2}}$, so accuracy
+    is lost quickly (and the powers may overflow) unless $|r|$ is close to
+    one. For $r=0$ the values $p(a), p(0), p(0), \dots$ are returned
+    directly.
+    
+    See also
+    --------
+    - for the roots of unity: [`polyval_unity`][poly.standard.polyval_unity]
+    - for arbitrary grids: [`PolyGrid`][poly.standard.PolyGrid]
+    
+    References
+    ----------
+    - [Wikipedia - Chirp Z-transform - Bluestein's algorithm](https://en.wikipedia.org/wiki/Chirp_Z-transform#Bluestein's_algorithm)
+    """
+    p = np.asarray(tuple(p), dtype=complex)
+    n = p.size
+    if n == 0 or m <= 0:
+        return np.zeros(max(m, 0), dtype=complex)
+    if r == 0:
+        #the chirps are undefined, the points are a, 0, 0, ...
+        return np.concatenate(([polyval_horner(p, complex(a))], np.full(m-1, p[0])))
+    logw = np.log(complex(r)) / 2
+    t = np.arange(-(n-1), m)
+    chirp = np.exp(t.astype(float)**2 * logw) #w^(t^2) for t=-(n-1),...,m-1
+    j = np.arange(n)
+    u = p * complex(a)**j * chirp[n-1::-1]
+    L = 1 << (n+m-2).bit_length()
+    y = np.fft.ifft(np.fft.fft(u, L) * np.fft.fft(1/chirp, L))
+    return chirp[n-1:] * y[n-1:n-1+m]
+
+def polyvalder(p, x, k=1, taylor=False):
+    r"""Return the value and the first `k` derivatives of polynomial `p` evaluated at point `x`.
+    
+    $$
+        \left(p(x), p'(x), \dots, p^{(k)}(x)\right)
+    $$
+    
+    Uses the extended Horner's method (repeated synthetic division) in a
+    single pass over the coefficients.
+    
+    More efficient than `polyval(polyder(p, j), x)` for every $j\le k$.
+    
+    `p` must be reversible.
+    
+    If `taylor` is set, the Taylor coefficients
+    $\left(p(x), p'(x), \frac{p''(x)}{2!}, \dots, \frac{p^{(k)}(x)}{k!}\right)$
+    are returned instead, which requires no factorial multiplications.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be at most
+    
+    - $n(k+1)$ scalar additions (`add`) &
+    - $n(k+1)+k$ scalar multiplications (`mul`).
+    
+    Notes
+    -----
+    Every Horner step $r_0\leftarrow r_0x+a_i$ is accompanied by the steps
+    $r_j\leftarrow r_jx+r_{j-1}$ for $j=1,\dots,k$. After the last
+    coefficient, $r_j=\frac{p^{(j)}(x)}{j!}$ are the coefficients of the Taylor
+    expansion of $p$ around $x$.
+    
+    See also
+    --------
+    - for the value only: [`polyval_horner`][poly.standard.polyval_horner]
+    - for the derivative polynomial: [`polyder`][poly.standard.polyder]
+    
+    References
+    ----------
+    - [Wikipedia - Horner's method - Polynomial evaluation and long division](https://en.wikipedia.org/wiki/Horner%27s_method#Polynomial_evaluation_and_long_division)
+    """
+    zero = type(x)(0)
+    p = iter(reversed(p))
+    r = [next(p, zero)]
+    for a in p:
+        m = len(r)
+        if m <= k:
+            r.append(r[-1])
+        for j in range(m-1, 0, -1):
+            r[j] = r[j]*x + r[j-1]
+        r[0] = r[0]*x + a
+    r.extend([zero] * (k+1 - len(r)))
+    if not taylor:
+        for j in range(2, len(r)):
+            r[j] = r[j] * factorial(j)
+    return tuple(r)
+
 def polycom(p, q, method='iterative'):
     r"""Return the polynomial composition of `p` & `q`.
     
@@ -193,14 +595,17 @@ def polycom(p, q, method='iterative'):
     Available methods are
     
     - [`naive`][poly.standard.polycom_naive],
-    - [`iterative`][poly.standard.polycom_iterative] &
-    - [`horner`][poly.standard.polycom_horner] (`p` must be reversible).
+    - [`iterative`][poly.standard.polycom_iterative],
+    - [`horner`][poly.standard.polycom_horner] (`p` must be reversible) &
+    - [`divconq`][poly.standard.polycom_divconq].
     
     See also
     --------
     - implementations: [`polycom_naive`][poly.standard.polycom_naive],
     [`polycom_iterative`][poly.standard.polycom_iterative],
-    [`polycom_horner`][poly.standard.polycom_horner]
+    [`polycom_horner`][poly.standard.polycom_horner],
+    [`polycom_divconq`][poly.standard.polycom_divconq]
+    - truncated to $\operatorname{mod}x^n$: [`polycom_brentkung`][poly.standard.polycom_brentkung]
     - for $q=x-s$: [`polyshift`][poly.standard.polyshift]
     - for scalar arguments: [`polyval`][poly.standard.polyval]
     """
@@ -211,6 +616,8 @@ def polycom(p, q, method='iterative'):
             return polycom_iterative(p, q)
         case 'horner':
             return polycom_horner(p, q)
+        case 'divconq':
+            return polycom_divconq(p, q)
         case _:
             raise ValueError('Invalid method')
 
@@ -299,28 +706,265 @@ def polycom_horner(p, q):
     - for any implementation: [`polycom`][poly.standard.polycom]
     - other implementations:
     [`polycom_naive`][poly.standard.polycom_naive],
-    [`polycom_iterative`][poly.standard.polycom_iterative]
+    [`polycom_iterative`][poly.standard.polycom_iterative],
+    [`polycom_divconq`][poly.standard.polycom_divconq]
     - for scalar arguments: [`polyval_horner`][poly.standard.polyval_horner]
     """
     p = iter(reversed(p))
     an = tuple(islice(p, 1))
     return reduce_default(lambda a, pi: polyaddc(polymul_naive(a, q), pi), p, initial=an, default=MISSING)
 
-def polyshift(p, s, one=1):
+def polycom_divconq(p, q):
+    r"""Return the polynomial composition of `p` & `q`.
+    
+    $$
+        p\circ q
+    $$
+    
+    Uses divide and conquer with the powers $q^{2^k}$ and
+    [`polymul_karatsuba`][poly.standard.polymul_karatsuba].
+    
+    Notes
+    -----
+    For $\deg p<2^k$ split $p=p_l+x^{2^{k-1}}p_h$ with $\deg p_l, \deg p_h<2^{k-1}$:
+    
+    $$
+        p\circ q = p_l\circ q + q^{2^{k-1}}\cdot(p_h\circ q)
+    $$
+    
+    The powers $q^{2^j}$ are computed once by repeated squaring and reused
+    on every level of the recursion. With a multiplication cost of $M(N)$
+    for the product degree $N=nm$ the total cost is $\mathcal{O}(M(nm)\log n)$.
+    
+    See also
+    --------
+    - for any implementation: [`polycom`][poly.standard.polycom]
+    - other implementations:
+    [`polycom_naive`][poly.standard.polycom_naive],
+    [`polycom_iterative`][poly.standard.polycom_iterative],
+    [`polycom_horner`][poly.standard.polycom_horner]
+    - truncated to $\operatorname{mod}x^n$: [`polycom_brentkung`][poly.standard.polycom_brentkung]
+    
+    References
+    ----------
+    - Joachim von zur Gathen & Jürgen Gerhard: Modern Computer Algebra, Chapter 9.
+    """
+    p, q = tuple(p), tuple(q)
+    if not p:
+        return () #polyzero
+    k = (len(p)-1).bit_length()
+    qs = [q] #qs[j] = q^(2^j)
+    while len(qs) < k:
+        qs.append(polymul_karatsuba(qs[-1], qs[-1]))
+    
+    def com(a, k):
+        if len(a) <= 1:
+            return a
+        m = 2**(k-1)
+        l, h = com(a[:m], k-1), com(a[m:], k-1)
+        return polyadd(l, polymul_karatsuba(qs[k-1], h))
+    return com(p, k)
+
+def polycom_brentkung(p, q, n):
+    r"""Return the polynomial composition of `p` & `q` truncated to degree less than `n`.
+    
+    $$
+        p\circ q \mod x^n
+    $$
+    
+    Uses the baby-step giant-step method of Brent and Kung with
+    [`polymul_karatsuba`][poly.standard.polymul_karatsuba]
+    on truncated polynomials.
+    
+    Notes
+    -----
+    Let $m=\left\lceil\sqrt{\deg p+1}\,\right\rceil$ and split $p$ into blocks
+    $p=\sum_jP_j(x)x^{jm}$ with $\deg P_j<m$. The baby steps
+    $q, q^2, \dots, q^m$ are computed $\operatorname{mod}x^n$, every
+    $P_j\circ q$ is a linear combination of them and the giant steps are a
+    Horner scheme in $q^m$:
+    
+    $$
+        p\circ q = \left(\cdots\left(P_{J}\circ q\right)q^m+P_{J-1}\circ q\right)q^m+\cdots+P_0\circ q \mod x^n
+    $$
+    
+    This needs only about $2\sqrt{\deg p}$ polynomial multiplications
+    instead of $\deg p$.
+    
+    See also
+    --------
+    - without truncation: [`polycom`][poly.standard.polycom]
+    - used by: [`polyrevert_series`][poly.standard.polyrevert_series]
+    
+    References
+    ----------
+    - Richard P. Brent & H. T. Kung: Fast Algorithms for Manipulating Formal Power Series. [10.1145/322092.322099](https://doi.org/10.1145/322092.322099)
+    """
+    p, q = tuple(p), tuple(q)[:n]
+    if not p or n <= 0:
+        return () #polyzero
+    m = isqrt(len(p)-1) + 1
+    qs = [q] #qs[i] = q^(i+1) mod x^n
+    for _ in range(m-1):
+        qs.append(polymul_karatsuba(qs[-1], q)[:n])
+    r = ()
+    for j in reversed(range(0, len(p), m)):
+        a = p[j:j+m]
+        r = polyadd(polymul_karatsuba(r, qs[-1])[:n],
+                    polyaddc(polyadd(*map(polyscalarmul, a[1:], qs)), a[0]))
+    return r
+
+def polyrevert_series(p, n, one=1):
+    r"""Return the compositional inverse of power series `p` truncated to degree less than `n`.
+    
+    $$
+        q \quad \text{with} \quad p\circ q = x \mod x^n
+    $$
+    
+    `p` must have no constant coefficient, $a_0=0$, and an invertible
+    linear coefficient $a_1$.
+    
+    Uses Newton iteration on $p(q)-x=0$,
+    
+    $$
+        q \leftarrow q - \frac{p(q)-x}{p'(q)} \mod x^{2m},
+    $$
+    
+    which doubles the number of correct coefficients $m$ in every step,
+    with truncated compositions by
+    [`polycom_brentkung`][poly.standard.polycom_brentkung] and series inversion by
+    [`polyinv_series`][poly.standard.polyinv_series].
+    
+    Complexity
+    ----------
+    $\mathcal{O}(\sqrt{n})$ multiplications of series of length $n$ per
+    composition, so $\mathcal{O}\left(n^{\frac{1}{2}+\log_23}\right)$ scalar
+    operations instead of $\mathcal{O}(n^3)$ for Lagrange inversion with
+    repeated compositions.
+    
+    Notes
+    -----
+    Only one composition is needed per step as $p'(q)=\frac{(p\circ q)'}{q'}$.
+    As $p(q)-x=\mathcal{O}(x^m)$ the reciprocal $\frac{1}{p'(q)}$ is only
+    needed to half the precision.
+    
+    Units $a_1=\pm1$ are their own inverses, so integer series with such a
+    linear coefficient stay integers, otherwise `one/a_1` is used.
+    
+    See also
+    --------
+    - uses: [`polycom_brentkung`][poly.standard.polycom_brentkung],
+    [`polyinv_series`][poly.standard.polyinv_series]
+    
+    References
+    ----------
+    - [Wikipedia - Lagrange inversion theorem](https://en.wikipedia.org/wiki/Lagrange_inversion_theorem)
+    - Richard P. Brent & H. T. Kung: Fast Algorithms for Manipulating Formal Power Series. [10.1145/322092.322099](https://doi.org/10.1145/322092.322099)
+    """
+    p = tuple(p)[:n]
+    if n <= 1:
+        return ()
+    if p and p[0]:
+        raise ValueError('Constant coefficient must be zero')
+    if len(p) < 2 or not p[1]:
+        raise ValueError('Linear coefficient must be invertible')
+    q, m = (0*p[1], p[1] if p[1] in (one, -one) else one/p[1]), 2
+    while m < n:
+        l, m = m, min(2*m, n)
+        r = polycom_brentkung(p, q, m)
+        e = polysubc(r, one, 1)[l:] #p(q)-x = O(x^l), so 1/p'(q) is only needed mod x^(m-l)
+        #1/p'(q) = q'/(p(q))'
+        dr = tuple(k*a for k, a in enumerate(r))[1:m-l+1]
+        dq = tuple(k*a for k, a in enumerate(q))[1:m-l+1]
+        d = polymul_karatsuba(dq, polyinv_series(dr, m-l, one))[:m-l]
+        q = polysub(q, polymulx(polymul_karatsuba(e, d)[:m-l], l))
+    return q[:n]
+
+def polyshift(p, s, one=1, method='horner'):
     """Return the polynomial `p` shifted by `s` on the abscissa.
     
     $$
         p(x - s)
     $$
     
-    TODO: https://math.stackexchange.com/a/694571/1170417
+    Available methods are
+    
+    - [`naive`][poly.standard.polyshift_naive] &
+    - [`horner`][poly.standard.polyshift_horner].
     
     See also
     --------
+    - implementations: [`polyshift_naive`][poly.standard.polyshift_naive],
+    [`polyshift_horner`][poly.standard.polyshift_horner]
     - for polynomial argument: [`polycom`][poly.standard.polycom]
     """
+    match method:
+        case 'naive':
+            return polyshift_naive(p, s, one=one)
+        case 'horner':
+            return polyshift_horner(p, s)
+        case _:
+            raise ValueError('Invalid method')
+
+def polyshift_naive(p, s, one=1):
+    """Return the polynomial `p` shifted by `s` on the abscissa.
+    
+    $$
+        p(x - s)
+    $$
+    
+    Uses naive composition with $x-s$ by [`polycom_naive`][poly.standard.polycom_naive].
+    
+    See also
+    --------
+    - for any implementation: [`polyshift`][poly.standard.polyshift]
+    - other implementations: [`polyshift_horner`][poly.standard.polyshift_horner]
+    """
     return polycom_naive(p, (-s, one))
 
+def polyshift_horner(p, s):
+    r"""Return the polynomial `p` shifted by `s` on the abscissa.
+    
+    $$
+        p(x - s)
+    $$
+    
+    Uses repeated synthetic division (Horner's method) on a copy of the
+    coefficients.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be
+    
+    - one scalar negation (`neg`),
+    - $\begin{cases}\frac{n(n+1)}{2}&n\ge0\\0&n\le0\end{cases}$ scalar additions (`add`) &
+    - $\begin{cases}\frac{n(n+1)}{2}&n\ge0\\0&n\le0\end{cases}$ scalar multiplications (`mul`).
+    
+    Notes
+    -----
+    The $i$-th pass of synthetic division by $x+s$ leaves the remainder
+    $\frac{p^{(i)}(-s)}{i!}$ in place, which is the $i$-th coefficient of
+    $p(x-s)$. Only additions and multiplications by $-s$ are needed, so
+    integer polynomials stay integers.
+    
+    See also
+    --------
+    - for any implementation: [`polyshift`][poly.standard.polyshift]
+    - other implementations: [`polyshift_naive`][poly.standard.polyshift_naive]
+    - for Taylor coefficients at a single point: [`polyvalder`][poly.standard.polyvalder]
+    
+    References
+    ----------
+    - [Math StackExchange - Shift polynomial](https://math.stackexchange.com/a/694571/1170417)
+    - [Wikipedia - Horner's method - Polynomial evaluation and long division](https://en.wikipedia.org/wiki/Horner%27s_method#Polynomial_evaluation_and_long_division)
+    """
+    a, t = list(p), -s
+    n = len(a) - 1
+    for i in range(n):
+        for j in range(n-1, i-1, -1):
+            a[j] = a[j] + t * a[j+1]
+    return tuple(a)
+
 def polyscale(p, a):
     """Return the polynomial `p` scaled by 1/`a` on the abscissa.
     
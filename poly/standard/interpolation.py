@@ -0,0 +1,284 @@
+from .creation import polyzero
+from .arithmetic import polyaddc, polysub, polyscalarmul, polymulx
+import numpy as np
+
+
+
+__all__ = ('PolyBarycentric', 'PolyNewton', 'polyfit', 'PolyFitter')
+
+
+
+class PolyBarycentric:
+    r"""Interpolating polynomial in barycentric Lagrange form.
+    
+    $$
+        p(x) = \frac{\sum_{j=0}^n\frac{w_j}{x-x_j}y_j}{\sum_{j=0}^n\frac{w_j}{x-x_j}} \qquad w_j = \frac{1}{\prod_{k\neq j}(x_j-x_k)}
+    $$
+    
+    Stores the nodes $x_j$, the values $y_j$ and the barycentric weights
+    $w_j$. The interpolant is evaluated directly from them, the monomial
+    coefficients are never formed. This is numerically stable for well
+    distributed nodes (e.g. Chebyshev points) even at high degrees, where
+    conversion to monomials and [`polyval_horner`][poly.standard.polyval_horner]
+    is not.
+    
+    Values are returned as `numpy.ndarray`s (or scalars for scalar arguments).
+    
+    Complexity
+    ----------
+    For $n+1$ nodes there will be
+    
+    - $\mathcal{O}(n^2)$ operations to create the interpolant,
+    - $\mathcal{O}(n)$ operations to add a node &
+    - $\mathcal{O}(n)$ operations per evaluation point.
+    
+    Notes
+    -----
+    The weights cancel in the quotient, so they are only stored up to a
+    common factor. Internally they are kept as logarithms of their moduli
+    and phases, and scaled to a maximum modulus of one, to avoid over- and
+    underflow for many nodes. A new node $x_{n+1}$ updates the existing
+    weights by $w_j\leftarrow\frac{w_j}{x_j-x_{n+1}}$.
+    
+    Points that coincide with a node return its value exactly.
+    
+    See also
+    --------
+    - for exact or streaming interpolation: [`PolyNewton`][poly.standard.PolyNewton]
+    - for polynomials in coefficient form on fixed points: [`PolyGrid`][poly.standard.PolyGrid]
+    
+    References
+    ----------
+    - Jean-Paul Berrut & Lloyd N. Trefethen: Barycentric Lagrange Interpolation. [10.1137/S0036144502417715](https://doi.org/10.1137/S0036144502417715)
+    - [Wikipedia - Lagrange polynomial - Barycentric form](https://en.wikipedia.org/wiki/Lagrange_polynomial#Barycentric_form)
+    """
+    
+    def __init__(self, xs=(), ys=()):
+        """Create the interpolant through the points `(xs[j], ys[j])`."""
+        xs, ys = np.ravel(xs), np.ravel(ys)
+        if xs.shape != ys.shape:
+            raise ValueError('Nodes and values must be of the same length')
+        self.xs, self.ys = xs[:0], ys[:0]
+        self._lw, self._sw = np.zeros(0), np.ones(0, dtype=np.result_type(xs, float))
+        self.ws = self._sw
+        for x, y in zip(xs, ys):
+            self.add(x, y)
+    
+    def __len__(self):
+        """Return the number of nodes."""
+        return self.xs.size
+    
+    def add(self, x, y):
+        """Add the node `x` with value `y`."""
+        d = self.xs - x
+        if np.any(d == 0):
+            raise ValueError('Nodes must be distinct')
+        #weights as logarithms of their moduli and phases to avoid over- and underflow
+        ad = np.abs(d)
+        ld = np.log(ad)
+        self._lw = np.append(self._lw - ld, -np.sum(ld))
+        self._sw = np.append(self._sw * (ad/d), np.prod(-ad/d))
+        self.ws = self._sw * np.exp(self._lw - np.max(self._lw))
+        self.xs, self.ys = np.append(self.xs, x), np.append(self.ys, y)
+    
+    def __call__(self, x):
+        """Return the value of the interpolant at point(s) `x`."""
+        x = np.asarray(x)
+        if not self.xs.size:
+            return np.zeros_like(x, dtype=np.result_type(x, self.ys))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d = x[..., np.newaxis] - self.xs
+            t = self.ws / d
+            p = (t @ self.ys) / np.sum(t, axis=-1)
+        exact = d == 0
+        hit = np.any(exact, axis=-1)
+        p = np.where(hit, self.ys[np.argmax(exact, axis=-1)], p)
+        return p[()]
+
+class PolyNewton:
+    r"""Incremental interpolating polynomial in Newton form.
+    
+    $$
+        p(x) = \sum_{k=0}^nc_k\prod_{j=0}^{k-1}(x-x_j) \qquad c_k = f[x_0, \dots, x_k]
+    $$
+    
+    Keeps the Newton coefficients (divided differences $c_k$) and the last
+    diagonal of the divided difference table $f[x_j, \dots, x_n]$, so a new
+    point is absorbed in $\mathcal{O}(n)$ without recalculating the whole
+    table. The coefficients in standard monomial basis are only formed on
+    demand by [`poly`][poly.standard.PolyNewton.poly].
+    
+    The class is type-independent like the functions in `poly.standard`
+    (e.g. exact with `Fraction`s), nodes and values must support the
+    necessary scalar operations.
+    
+    Complexity
+    ----------
+    For $n+1$ points there will be
+    
+    - $\mathcal{O}(n)$ scalar operations to add a point,
+    - $\mathcal{O}(n)$ scalar operations per evaluation &
+    - $\mathcal{O}(n^2)$ scalar operations for the monomial coefficients.
+    
+    Notes
+    -----
+    With the diagonal $r_j=f[x_j, \dots, x_n]$ a new point $(x_{n+1}, y_{n+1})$ gives
+    
+    $$
+        r_{n+1}' = y_{n+1} \qquad r_j' = \frac{r_{j+1}'-r_j}{x_{n+1}-x_j} \qquad c_{n+1} = r_0'.
+    $$
+    
+    See also
+    --------
+    - for floating point interpolation on many nodes: [`PolyBarycentric`][poly.standard.PolyBarycentric]
+    - for least squares fits: [`PolyFitter`][poly.standard.PolyFitter]
+    
+    References
+    ----------
+    - [Wikipedia - Newton polynomial](https://en.wikipedia.org/wiki/Newton_polynomial)
+    - [Wikipedia - Divided differences](https://en.wikipedia.org/wiki/Divided_differences)
+    """
+    
+    def __init__(self, xs=(), ys=()):
+        """Create the interpolant through the points `(xs[j], ys[j])`."""
+        self.xs, self.cs, self._r = [], [], []
+        for x, y in zip(xs, ys, strict=True):
+            self.add(x, y)
+    
+    def __len__(self):
+        """Return the number of points."""
+        return len(self.xs)
+    
+    def add(self, x, y):
+        """Add the point `(x, y)`."""
+        if any(x == xj for xj in self.xs):
+            raise ValueError('Nodes must be distinct')
+        r = [y]
+        for xj, rj in zip(reversed(self.xs), reversed(self._r)):
+            r.append((r[-1] - rj) / (x - xj))
+        self._r = r[::-1]
+        self.xs.append(x)
+        self.cs.append(r[-1])
+    
+    def __call__(self, x):
+        """Return the value of the interpolant at point `x`."""
+        if not self.cs:
+            return type(x)(0)
+        y = self.cs[-1]
+        for xk, ck in zip(reversed(self.xs[:-1]), reversed(self.cs[:-1])):
+            y = y*(x - xk) + ck
+        return y
+    
+    def poly(self):
+        """Return the interpolating polynomial in standard monomial basis."""
+        p = polyzero
+        for xk, ck in zip(reversed(self.xs), reversed(self.cs)):
+            p = polyaddc(polysub(polymulx(p), polyscalarmul(xk, p)), ck)
+        return p
+
+def polyfit(xs, ys, n, w=None, vander=None, method='qr'):
+    r"""Return the least squares polynomial of degree `n` through the points `(xs[i], ys[i])`.
+    
+    $$
+        \arg\min_{p\in\mathbb{P}_n}\sum_i|w_i(p(x_i)-y_i)|^2
+    $$
+    
+    Like in `numpy` the weights `w` multiply the unsquared residuals, so
+    $w_i=1/\sigma_i$ for samples with standard deviations $\sigma_i$.
+    
+    Coefficients are returned as a `tuple` in the basis of `vander`
+    (standard monomial basis by default). For `vander` and `method` see
+    [`PolyFitter`][poly.standard.PolyFitter].
+    
+    See also
+    --------
+    - for streamed data: [`PolyFitter`][poly.standard.PolyFitter]
+    
+    References
+    ----------
+    - `numpy` equivalent: [`numpy.polynomial.polynomial.polyfit`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.polynomial.polyfit.html)
+    """
+    fitter = PolyFitter(n, vander, method)
+    fitter.add(xs, ys, w)
+    return fitter.fit()
+
+class PolyFitter:
+    r"""Streaming least squares fit of a polynomial of degree `n`.
+    
+    $$
+        \arg\min_{\vec{c}}\left\|V\vec{c}-\vec{y}\right\|_2 \qquad V_{ik}=\phi_k(x_i)
+    $$
+    
+    Data is added in chunks with [`add`][poly.standard.PolyFitter.add].
+    Only an $(n+2)\times(n+2)$ summary of all samples seen so far is kept,
+    so memory is $\mathcal{O}(n^2)$ independent of the number of samples.
+    
+    Available methods are
+    
+    - `qr`: incremental QR decomposition (numerically stable) &
+    - `normal`: accumulated normal equations $V^TV\vec{c}=V^T\vec{y}$
+    (faster, but squares the condition number).
+    
+    `vander(xs, n)` returns the basis functions $\phi_k(x_i)$ as an array of
+    shape `(len(xs), n+1)`, the monomials
+    [`numpy.polynomial.polynomial.polyvander`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.polynomial.polyvander.html)
+    by default. With e.g. [`hermvander`][poly.hermite.hermvander] the fit
+    is a Hermite series, which is much better conditioned for
+    higher degrees than the monomials.
+    
+    Complexity
+    ----------
+    For a chunk of $m$ samples there will be $\mathcal{O}(mn^2)$ operations,
+    one QR decomposition of a $(m+n+2)\times(n+2)$ matrix or one matrix product
+    $V^TV$ respectively.
+    
+    Notes
+    -----
+    For the QR method the values are appended as last column, $A=(V|\vec{y})$,
+    so only the triangular factor has to be kept: with the old factor $R$ a
+    chunk $A_\text{new}$ gives
+    
+    $$
+        \begin{pmatrix}R \\ A_\text{new}\end{pmatrix} = Q'R' \qquad R = \begin{pmatrix}R_V & \vec{z} \\ 0 & \rho\end{pmatrix},
+    $$
+    
+    the coefficients solve $R_V\vec{c}=\vec{z}$ and $\rho^2$ is the residual sum of squares.
+    
+    See also
+    --------
+    - for all data at once: [`polyfit`][poly.standard.polyfit]
+    
+    References
+    ----------
+    - [Wikipedia - QR decomposition - Using for solution to linear inverse problems](https://en.wikipedia.org/wiki/QR_decomposition#Using_for_solution_to_linear_inverse_problems)
+    - [Wikipedia - Linear least squares - Normal equations](https://en.wikipedia.org/wiki/Linear_least_squares#Main_formulations)
+    """
+    
+    def __init__(self, n, vander=None, method='qr'):
+        """Create a fitter for polynomials of degree `n` in the basis of `vander`."""
+        if method not in ('qr', 'normal'):
+            raise ValueError('Invalid method')
+        self.n, self.method = n, method
+        self.vander = np.polynomial.polynomial.polyvander if vander is None else vander
+        self.R = np.zeros((0, n+2)) if method == 'qr' else np.zeros((n+2, n+2))
+        self.count = 0
+    
+    def add(self, xs, ys, w=None):
+        """Add the samples `(xs[i], ys[i])` with optional weights `w[i]` of the unsquared residuals."""
+        xs, ys = np.ravel(xs), np.ravel(ys)
+        A = np.hstack((self.vander(xs, self.n), ys[:, np.newaxis]))
+        if w is not None:
+            A = A * np.ravel(w)[:, np.newaxis]
+        match self.method:
+            case 'qr':
+                self.R = np.linalg.qr(np.vstack((self.R, A)), mode='r')
+            case 'normal':
+                self.R = self.R + A.conj().T @ A
+        self.count += xs.size
+    
+    def fit(self):
+        """Return the coefficients of the least squares fit of all samples so far."""
+        R, z = self.R[:self.n+1, :self.n+1], self.R[:self.n+1, self.n+1]
+        if R.shape[0] == 0:
+            return (0.0,) * (self.n+1)
+        return tuple(np.linalg.lstsq(R, z, rcond=None)[0].tolist())
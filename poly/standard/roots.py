@@ -0,0 +1,498 @@
+from math import gcd
+from fractions import Fraction
+from .arithmetic import polysub, polyscalarmul, polyscalarfloordiv, polymulx
+from .evaluation import polyshift_horner, polyscale
+from .calculus import polyder
+import numpy as np
+
+
+
+__all__ = ('polyroots', 'polyroots_aberth', 'polyroots_companion',
+           'polyroots_batch', 'polysignvar', 'polyisolate')
+
+
+
+def polyroots(p, method='aberth'):
+    r"""Return the complex roots of polynomial `p`.
+    
+    $$
+        \{x\in\mathbb{C} \mid p(x)=0\}
+    $$
+    
+    Roots are returned with multiplicity as a complex `numpy.ndarray`.
+    Leading zero coefficients are ignored, constant polynomials have no roots.
+    
+    Available methods are
+    
+    - [`aberth`][poly.standard.polyroots_aberth] &
+    - [`companion`][poly.standard.polyroots_companion].
+    
+    See also
+    --------
+    - implementations: [`polyroots_aberth`][poly.standard.polyroots_aberth],
+    [`polyroots_companion`][poly.standard.polyroots_companion]
+    - for many polynomials of degree at most four: [`polyroots_batch`][poly.standard.polyroots_batch]
+    - inverse: [`polyfromroots`][poly.standard.polyfromroots]
+    
+    References
+    ----------
+    - `numpy` equivalent: [`numpy.polynomial.polynomial.polyroots`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.polynomial.polyroots.html)
+    """
+    match method:
+        case 'aberth':
+            return polyroots_aberth(p)
+        case 'companion':
+            return polyroots_companion(p)
+        case _:
+            raise ValueError('Invalid method')
+
+def _polytrimzeros(p):
+    """Return `p` as complex array without exactly zero leading coefficients."""
+    p = np.asarray(tuple(p), dtype=complex)
+    nz = np.flatnonzero(p)
+    return p[:nz[-1]+1] if nz.size else p[:0]
+
+def _polyvalabsder(a, z):
+    """Return $p(z)$, $p'(z)$ & $\\sum_k|a_k||z|^k$ for all `z` by Horner's method."""
+    p, dp = np.full_like(z, a[-1]), np.zeros_like(z)
+    s, absz = np.full(z.shape, abs(a[-1])), np.abs(z)
+    for ak in a[-2::-1]:
+        dp = dp*z + p
+        p = p*z + ak
+        s = s*absz + abs(ak)
+    return p, dp, s
+
+def _aberth_initial(a):
+    """Return starting values on circles with radii from the upper convex hull of $(k, \\log|a_k|)$."""
+    with np.errstate(divide='ignore'):
+        l = np.log(np.abs(a))
+    hull = []
+    for k in np.flatnonzero(np.isfinite(l)):
+        while len(hull) >= 2 and (l[hull[-1]]-l[hull[-2]])*(k-hull[-1]) <= (l[k]-l[hull[-1]])*(hull[-1]-hull[-2]):
+            hull.pop()
+        hull.append(k)
+    z = [np.zeros(hull[0])]
+    for i, j in zip(hull, hull[1:]):
+        u = np.exp((l[i]-l[j]) / (j-i))
+        z.append(u * np.exp(1j*(2*np.pi*np.arange(j-i)/(j-i) + 2*np.pi*i/a.size + 0.4)))
+    return np.concatenate(z)
+
+def polyroots_aberth(p, tol=4*np.finfo(float).eps, maxiter=100, x0=None):
+    r"""Return the complex roots of polynomial `p`.
+    
+    $$
+        \{x\in\mathbb{C} \mid p(x)=0\}
+    $$
+    
+    Uses the Aberth–Ehrlich method, a simultaneous Newton iteration for
+    all roots, vectorised over the roots.
+    
+    Starting values `x0` are optional, otherwise points on circles with
+    radii from the Newton polygon of the coefficients are used.
+    
+    A root stops being updated once
+    
+    - the Aberth correction is smaller than `tol` relative to the root or
+    - $|p(z)|$ is below the rounding error bound $\text{tol}\sum_k|a_k||z|^k$,
+    
+    and the iteration ends when all roots stopped or after `maxiter` sweeps.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ every sweep takes $\mathcal{O}(n^2)$
+    scalar operations, $\mathcal{O}(n)$ vectorised Horner steps for
+    $p$ & $p'$ and one $n\times n$ array of pairwise differences.
+    
+    Notes
+    -----
+    The update for the root approximations $z_k$ is
+    
+    $$
+        z_k \leftarrow z_k - \frac{\frac{p(z_k)}{p'(z_k)}}{1-\frac{p(z_k)}{p'(z_k)}\sum_{j\ne k}\frac{1}{z_k-z_j}}.
+    $$
+    
+    For $|z|>1$ the Newton ratio is evaluated on the reversed polynomial
+    $q(y)=y^np\left(\frac{1}{y}\right)$ at $y=\frac{1}{z}$ to avoid overflow
+    $$
+        \frac{p(z)}{p'(z)} = \frac{1}{y\left(n-y\frac{q'(y)}{q(y)}\right)}.
+    $$
+    
+    See also
+    --------
+    - for any implementation: [`polyroots`][poly.standard.polyroots]
+    - other implementations: [`polyroots_companion`][poly.standard.polyroots_companion]
+    
+    References
+    ----------
+    - [Wikipedia - Aberth method](https://en.wikipedia.org/wiki/Aberth_method)
+    - Dario A. Bini: Numerical computation of polynomial zeros by means of Aberth's method. [10.1007/BF02207694](https://doi.org/10.1007/BF02207694)
+    """
+    a = _polytrimzeros(p)
+    n = a.size - 1
+    if n <= 0:
+        return np.empty(0, dtype=complex)
+    
+    z = np.array(x0 if x0 is not None else _aberth_initial(a), dtype=complex)
+    a_rev = a[::-1]
+    
+    active = np.ones(n, dtype=bool)
+    with np.errstate(all='ignore'):
+        for _ in range(maxiter):
+            if not active.any():
+                break
+            idx = np.flatnonzero(active)
+            za = z[idx]
+            ratio, small = np.empty_like(za), np.empty(za.shape, dtype=bool)
+            inner = np.abs(za) <= 1
+            
+            pz, dpz, s = _polyvalabsder(a, za[inner])
+            ratio[inner] = pz / dpz
+            small[inner] = np.abs(pz) <= tol*s
+            
+            y = 1 / za[~inner]
+            qy, dqy, s = _polyvalabsder(a_rev, y)
+            ratio[~inner] = 1 / (y*(n - y*dqy/qy))
+            small[~inner] = np.abs(qy) <= tol*s
+            
+            d = za[:, np.newaxis] - z[np.newaxis, :]
+            d[np.arange(idx.size), idx] = np.inf
+            w = ratio / (1 - ratio*np.sum(1/d, axis=1))
+            w[~np.isfinite(w)] = 0
+            
+            z[idx] = za - w
+            active[idx] = ~small & (np.abs(w) > tol*np.abs(za))
+    return z
+
+def polyroots_companion(p):
+    r"""Return the complex roots of polynomial `p`.
+    
+    $$
+        \{x\in\mathbb{C} \mid p(x)=0\}
+    $$
+    
+    Uses the eigenvalues of the companion matrix.
+    
+    The coefficients are converted to `float`s (or `complex`).
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ the eigenvalue decomposition takes
+    $\mathcal{O}(n^3)$ operations.
+    
+    Notes
+    -----
+    The companion matrix of $p(x)=\sum_{k=0}^na_kx^k$
+    
+    $$
+        C = \begin{pmatrix}
+            0 & & & -\frac{a_0}{a_n} \\
+            1 & \ddots & & \vdots \\
+            & \ddots & 0 & \vdots \\
+            & & 1 & -\frac{a_{n-1}}{a_n}
+        \end{pmatrix}
+    $$
+    
+    has $p$ as characteristic polynomial, so its eigenvalues are the roots of $p$.
+    
+    See also
+    --------
+    - for any implementation: [`polyroots`][poly.standard.polyroots]
+    - other implementations: [`polyroots_aberth`][poly.standard.polyroots_aberth]
+    
+    References
+    ----------
+    - [Wikipedia - Companion matrix](https://en.wikipedia.org/wiki/Companion_matrix)
+    - `numpy` equivalent: [`numpy.polynomial.polynomial.polyroots`](https://numpy.org/doc/stable/reference/generated/numpy.polynomial.polynomial.polyroots.html)
+    """
+    a = _polytrimzeros(p)
+    n = a.size - 1
+    if n <= 0:
+        return np.empty(0, dtype=complex)
+    if not a.imag.any():
+        a = a.real
+    C = np.zeros((n, n), dtype=a.dtype)
+    C[np.arange(1, n), np.arange(n-1)] = 1
+    C[:, -1] = -a[:-1] / a[-1]
+    return np.linalg.eigvals(C).astype(complex)
+
+def polyroots_batch(P, polish=2):
+    r"""Return the complex roots of many polynomials of the same low degree.
+    
+    $$
+        \{x\in\mathbb{C} \mid p_i(x)=0\} \quad \forall i
+    $$
+    
+    `P` is an array of coefficients of shape $(N, d+1)$ with $d\le4$ and
+    non-zero leading coefficients. Returns a complex `numpy.ndarray` of
+    shape $(N, d)$ with the roots of every polynomial (with multiplicity)
+    in no particular order.
+    
+    The roots are calculated for all polynomials at once by closed form
+    formulas (numerically stable quadratic formula, Cardano, Ferrari) with
+    vectorised `numpy` operations and then polished with `polish` Newton
+    steps. A Newton step is only taken where it decreases $|p_i(x)|$.
+    
+    Complexity
+    ----------
+    $\mathcal{O}(N)$ vectorised operations, no Python loop over the
+    polynomials.
+    
+    Notes
+    -----
+    A quartic is depressed to $y^4+py^2+qy+r$ with $x=y-\frac{a_3}{4a_4}$.
+    With a root $m\neq0$ of the resolvent cubic
+    
+    $$
+        8m^3+8pm^2+(2p^2-8r)m-q^2=0
+    $$
+    
+    it factors into two quadratics
+    
+    $$
+        \left(y^2+\sqrt{2m}y+\frac{p}{2}+m-\frac{q}{2\sqrt{2m}}\right)\left(y^2-\sqrt{2m}y+\frac{p}{2}+m+\frac{q}{2\sqrt{2m}}\right).
+    $$
+    
+    For $q=0$ the quartic is biquadratic and solved as a quadratic in $y^2$.
+    
+    See also
+    --------
+    - for a single polynomial of any degree: [`polyroots`][poly.standard.polyroots]
+    
+    References
+    ----------
+    - [Wikipedia - Quadratic formula - Numerical calculation](https://en.wikipedia.org/wiki/Quadratic_formula#Numerical_calculation)
+    - [Wikipedia - Cubic equation - Cardano's formula](https://en.wikipedia.org/wiki/Cubic_equation#Cardano's_formula)
+    - [Wikipedia - Quartic function - Ferrari's solution](https://en.wikipedia.org/wiki/Quartic_function#Ferrari's_solution)
+    """
+    P = np.asarray(P)
+    if P.ndim != 2:
+        raise ValueError('Coefficients must be of shape (N, d+1)')
+    d = P.shape[1] - 1
+    P = P.astype(complex)
+    match d:
+        case 0:
+            X = np.empty((P.shape[0], 0), dtype=complex)
+        case 1:
+            X = -P[:, :1] / P[:, 1:]
+        case 2:
+            X = np.stack(_quadratic(P[:, 2], P[:, 1], P[:, 0]), axis=-1)
+        case 3:
+            a = P[:, :3] / P[:, 3:]
+            X = np.stack(_cubic(a[:, 2], a[:, 1], a[:, 0]), axis=-1)
+        case 4:
+            a = P[:, :4] / P[:, 4:]
+            X = np.stack(_quartic(a[:, 3], a[:, 2], a[:, 1], a[:, 0]), axis=-1)
+        case _:
+            raise ValueError('Degree must be at most 4')
+    
+    D = P[:, 1:] * np.arange(1, d+1)
+    with np.errstate(all='ignore'):
+        px = _polyvalbatch(P, X)
+        for _ in range(polish):
+            Y = X - px / _polyvalbatch(D, X)
+            py = _polyvalbatch(P, Y)
+            better = np.isfinite(Y) & (np.abs(py) < np.abs(px))
+            X, px = np.where(better, Y, X), np.where(better, py, px)
+    return X
+
+def _polyvalbatch(P, X):
+    """Return $p_i(x_{ij})$ for coefficients `P` of shape $(N, d+1)$ and points `X` of shape $(N, m)$."""
+    Y = np.zeros_like(X)
+    for i in range(P.shape[1]-1, -1, -1):
+        Y = Y*X + P[:, i:i+1]
+    return Y
+
+def _quadratic(a, b, c):
+    """Return both roots of $ax^2+bx+c$ without cancellation."""
+    s = np.sqrt(b*b - 4*a*c)
+    s = np.where((b.conjugate()*s).real >= 0, s, -s)
+    q = -(b + s) / 2
+    with np.errstate(all='ignore'):
+        return q / a, np.where(q != 0, c / q, 0)
+
+def _cubic(a, b, c):
+    """Return the three roots of $x^3+ax^2+bx+c$."""
+    p = b - a*a/3
+    q = 2*a**3/27 - a*b/3 + c
+    s = np.sqrt(q*q/4 + p**3/27)
+    s = np.where((q.conjugate()*s).real >= 0, s, -s) #larger of both to avoid cancellation
+    u = (-q/2 - s) ** (1/3)
+    w = np.exp(2j*np.pi/3)
+    with np.errstate(all='ignore'):
+        return tuple(np.where(u != 0, u*w**k - p/(3*u*w**k), 0) - a/3 for k in range(3))
+
+def _quartic(a, b, c, d):
+    """Return the four roots of $x^4+ax^3+bx^2+cx+d$."""
+    p = b - 3*a*a/8
+    q = c - a*b/2 + a**3/8
+    r = d - a*c/4 + a*a*b/16 - 3*a**4/256
+    m = np.stack(_cubic(p, (p*p/4 - r), -q*q/8), axis=-1)
+    m = m[np.arange(m.shape[0]), np.argmax(np.abs(m), axis=-1)]
+    biquadratic = m == 0
+    with np.errstate(all='ignore'):
+        s = np.sqrt(2*m)
+        t = np.where(biquadratic, 0, q / (2*s))
+        one = np.ones_like(s)
+        y = _quadratic(one, s, p/2 + m - t) + _quadratic(one, -s, p/2 + m + t)
+        z = _quadratic(one, p, r)
+        z = (np.sqrt(z[0]), -np.sqrt(z[0]), np.sqrt(z[1]), -np.sqrt(z[1]))
+    return tuple(np.where(biquadratic, zi, yi) - a/4 for yi, zi in zip(y, z))
+
+def polysignvar(p):
+    r"""Return the number of sign variations in the coefficients of polynomial `p`.
+    
+    $$
+        \operatorname{var}(a_0, a_1, \dots, a_n)
+    $$
+    
+    Zero coefficients are skipped.
+    
+    By Descartes' rule of signs this is an upper bound for the number of
+    positive real roots and differs from it by an even number.
+    
+    Complexity
+    ----------
+    For a polynomial of degree $n$ there will be
+    
+    - $n+1$ scalar boolean evaluations (`bool`) &
+    - $\mathcal{O}(n)$ scalar comparisons (`lt`).
+    
+    See also
+    --------
+    - used by: [`polyisolate`][poly.standard.polyisolate]
+    
+    References
+    ----------
+    - [Wikipedia - Descartes' rule of signs](https://en.wikipedia.org/wiki/Descartes%27_rule_of_signs)
+    """
+    v, last = 0, None
+    for a in p:
+        if a:
+            s = a < 0
+            if last is not None and s != last:
+                v += 1
+            last = s
+    return v
+
+def _polytrimint(p):
+    """Return the integer polynomial `p` without zero leading coefficients."""
+    p = list(p)
+    while p and not p[-1]:
+        p.pop()
+    return tuple(p)
+
+def _polyprimitive(p):
+    """Return the primitive part of integer polynomial `p` with positive leading coefficient."""
+    g = gcd(*p)
+    return polyscalarfloordiv(p, g if p[-1]>0 else -g) if g else p
+
+def _polygcd(p, q):
+    """Return the primitive greatest common divisor of two integer polynomials."""
+    p, q = _polyprimitive(_polytrimint(p)), _polyprimitive(_polytrimint(q))
+    if len(p) < len(q):
+        p, q = q, p
+    while q:
+        while len(p) >= len(q): #pseudo-remainder
+            p = _polytrimint(polysub(polyscalarmul(q[-1], p),
+                    polymulx(polyscalarmul(p[-1], q), len(p)-len(q))))
+        p, q = q, _polyprimitive(p) if p else p
+    return p
+
+def _polyexactdiv(p, q):
+    """Return the quotient of integer polynomial `p` and a divisor `q` (primitive, exact)."""
+    r, d = list(p), []
+    for i in range(len(p)-len(q), -1, -1):
+        c = r[i+len(q)-1] // q[-1]
+        for j, qj in enumerate(q):
+            r[i+j] -= c * qj
+        d.append(c)
+    return tuple(reversed(d))
+
+def polyisolate(p):
+    r"""Return isolating intervals for the real roots of integer polynomial `p`.
+    
+    $$
+        \{(a_i, b_i)\}_i \quad \text{with} \quad \exists!\,x_i\in(a_i, b_i): p(x_i)=0
+    $$
+    
+    Returns a list of pairs of `Fraction`s in ascending order. Every pair is
+    either an open interval containing exactly one real root or, for a
+    rational root found exactly, the degenerated interval $(x_i, x_i)$.
+    Multiple roots are only reported once.
+    
+    Uses the Vincent–Collins–Akritas bisection method with Descartes' rule
+    of signs. All computations are exact integer arithmetic without
+    `Fraction`s: the square-free part by integer pseudo-remainders,
+    the bisection by [`polyscale`][poly.standard.polyscale]-like power of two
+    scaling and the Taylor shifts by
+    [`polyshift_horner`][poly.standard.polyshift_horner].
+    
+    Notes
+    -----
+    Roots are bounded by $|x|<2^K$ (Fujiwara bound), so the positive roots
+    of $p$ are the roots of $q(x)=p(2^Kx)$ in $(0, 1)$ (and the negative
+    ones those of $p(-2^Kx)$). The number of roots of $q$ in $(0, 1)$ is
+    bounded by
+    
+    $$
+        \operatorname{var}\left((x+1)^nq\left(\frac{1}{x+1}\right)\right),
+    $$
+    
+    which is the number of sign variations of the reversed coefficients
+    shifted by one. If it is zero, there is no root; if it is one, there is
+    exactly one. Otherwise $(0, 1)$ is bisected into
+    $2^nq\left(\frac{x}{2}\right)$ and $2^nq\left(\frac{x+1}{2}\right)$.
+    
+    See also
+    --------
+    - uses: [`polysignvar`][poly.standard.polysignvar],
+    [`polyshift_horner`][poly.standard.polyshift_horner]
+    - for approximations of all complex roots: [`polyroots`][poly.standard.polyroots]
+    
+    References
+    ----------
+    - [Wikipedia - Vincent's theorem - Bisection method](https://en.wikipedia.org/wiki/Vincent%27s_theorem#Vincent%E2%80%93Collins%E2%80%93Akritas_(VCA,_1976))
+    - George E. Collins & Alkiviadis G. Akritas: Polynomial real root isolation using Descarte's rule of signs. [10.1145/800205.806346](https://doi.org/10.1145/800205.806346)
+    """
+    p = _polytrimint(p)
+    if len(p) <= 1:
+        return []
+    p = _polyprimitive(p)
+    g = _polygcd(p, polyder(p))
+    if len(g) > 1:
+        p = _polyexactdiv(p, g)
+    
+    roots = []
+    if p[0] == 0:
+        roots.append((Fraction(0), Fraction(0)))
+        p = p[1:]
+    if len(p) > 1:
+        #Fujiwara bound 2*max|a_(n-i)/a_n|^(1/i) < 2^K
+        n, m = len(p)-1, abs(p[-1]).bit_length()
+        K = 1 + max(0, max(-((m-1-abs(a).bit_length()) // i)
+                for i, a in enumerate(reversed(p[:-1]), 1) if a))
+        for sign in (-1, +1):
+            for a, b in _polyisolate01(polyscale(p, sign*2**K)):
+                a, b = sign*2**K*a, sign*2**K*b
+                roots.append((min(a, b), max(a, b)))
+    return sorted(roots)
+
+def _polyisolate01(q):
+    """Yield isolating intervals of the roots of the square-free integer polynomial `q` in $(0, 1)$."""
+    stack = [(0, 0, q)] #interval (c/2^k, (c+1)/2^k) with q transformed to (0, 1)
+    while stack:
+        c, k, q = stack.pop()
+        if not polysignvar(q): #no positive roots at all
+            continue
+        v = polysignvar(polyshift_horner(tuple(reversed(q)), -1))
+        if v == 1:
+            yield Fraction(c, 2**k), Fraction(c+1, 2**k)
+        elif v > 1:
+            n = len(q) - 1
+            l = tuple(qi << (n-i) for i, qi in enumerate(q))
+            r = polyshift_horner(l, -1)
+            if r[0] == 0:
+                yield Fraction(2*c+1, 2**(k+1)), Fraction(2*c+1, 2**(k+1))
+                r = r[1:]
+            stack.append((2*c+1, k+1, r))
+            stack.append((2*c, k+1, l))
@@ -1,8 +1,12 @@
+from math import ceil, log
+from random import randrange
+from functools import partial
+from .evaluation import polyval_mod
 from vector import veclen, veceq, vectrim
 
 
 
-__all__ = ('polydeg', 'polyeq', 'polytrim')
+__all__ = ('polydeg', 'polyeq', 'polyeq_probabilistic', 'polytrim')
 
 
 
@@ -51,9 +55,121 @@ def polyeq(p, q):
     See also
     --------
     - wraps: [`vector.veceq`](https://goessl.github.io/vector/functional/#vector.functional.utility.veceq)
+    - for huge or implicit polynomials: [`polyeq_probabilistic`][poly.standard.polyeq_probabilistic]
     """
     return veceq(p, q)
 
+def polyeq_probabilistic(p, q, n=None, tol=2**-100, bits=62):
+    r"""Return if two polynomials are equal with high probability.
+    
+    $$
+        p(x_i) \equiv q(x_i) \pmod{m_i} \qquad m_i\sim\mathcal{U}(\{\text{primes in } [2^{b-1}, 2^b)\}), \ x_i\sim\mathcal{U}(\{0, \dots, m_i-1\})
+    $$
+    
+    `p` and `q` are either integer coefficient sequences or callables
+    `(x, m) -> p(x) % m`, so pipelines of products, compositions or basis
+    conversions can be checked by evaluating their factors at random points
+    without ever forming the full coefficient tuples, e.g.
+    `lambda x, m: polyval_mod(s, polyval_mod(t, x, m), m)` for $s\circ t$.
+    
+    `n` is an upper bound for the degree of $p-q$. It can be omitted if
+    both are sequences.
+    
+    Every trial draws a fresh random prime modulus $m_i$ of `bits` bits, so
+    coefficients that are multiples of a fixed modulus can't slip through.
+    If `False` is returned, the polynomials are definitely different. If
+    `True` is returned, they are equal except with probability at most
+    `tol`. For callables the coefficients of $p-q$ are assumed to have
+    less than $2^{32}$ bits.
+    
+    Raises `ValueError` if `n` is too large for `bits`-bit moduli.
+    
+    Complexity
+    ----------
+    $\left\lceil\frac{\log\text{tol}}{\log\varepsilon}\right\rceil$
+    evaluations of `p` & `q` modulo random primes (at least one), with
+    $\varepsilon$ as below.
+    
+    Notes
+    -----
+    Let $d=p-q\neq0$ with coefficients of at most $c$ bits. A prime
+    $m\geq2^{b-1}$ divides all coefficients of $d$ only if it divides
+    the largest one, which has at most $\frac{c}{b-1}$ such prime factors.
+    There are at least $\frac{2^{b-1}}{2b}$ primes in $[2^{b-1}, 2^b)$, so
+    $d\equiv0\pmod{m}$ with probability at most $\frac{2bc}{(b-1)2^{b-1}}$.
+    Otherwise $d$ has at most $n$ roots modulo $m$, so a random point reveals
+    $p\neq q$ with probability at least $1-\frac{n}{m}$ (Schwartz–Zippel
+    lemma). Each trial therefore errs with probability at most
+    $$
+        \varepsilon = \frac{n+\frac{2bc}{b-1}}{2^{b-1}}
+    $$
+    and after $k$ independent trials with at most $\varepsilon^k$.
+    
+    Primes are found by rejection sampling with the Miller–Rabin test.
+    
+    See also
+    --------
+    - deterministic: [`polyeq`][poly.standard.polyeq]
+    - uses: [`polyval_mod`][poly.standard.polyval_mod]
+    
+    References
+    ----------
+    - [Wikipedia - Schwartz–Zippel lemma](https://en.wikipedia.org/wiki/Schwartz%E2%80%93Zippel_lemma)
+    - [Wikipedia - Miller–Rabin primality test](https://en.wikipedia.org/wiki/Miller%E2%80%93Rabin_primality_test)
+    """
+    p, q = (f if callable(f) else tuple(f) for f in (p, q))
+    if n is None:
+        if callable(p) or callable(q):
+            raise ValueError('Degree bound n required for callables')
+        n = max(len(p), len(q)) - 1
+    if callable(p) or callable(q):
+        c = 2**32
+    else:
+        c = max((int(a).bit_length() for a in p+q), default=0) + 1
+    eps = (max(n, 0) + 2*bits*c/(bits-1)) / 2**(bits-1)
+    if eps >= 1:
+        raise ValueError('Degree bound too large for the modulus size')
+    trials = max(ceil(log(tol) / log(eps)), 1)
+    p, q = (f if callable(f) else partial(polyval_mod, f) for f in (p, q))
+    for _ in range(trials):
+        m = _randprime(bits)
+        x = randrange(m)
+        if p(x, m) != q(x, m):
+            return False
+    return True
+
+def _randprime(bits):
+    #rejection sampling, about bits*ln(2)/2 candidates on average
+    while True:
+        m = randrange(1<<(bits-1), 1<<bits) | 1
+        if _isprime(m):
+            return m
+
+def _isprime(m):
+    #Miller-Rabin, deterministic for m < 3.3*10^24 (82 bits)
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    if m < 2:
+        return False
+    for a in bases:
+        if m % a == 0:
+            return m == a
+    if m >= 3317044064679887385961981:
+        bases += tuple(randrange(2, m-1) for _ in range(32))
+    d, s = m-1, 0
+    while d % 2 == 0:
+        d, s = d//2, s+1
+    for a in bases:
+        x = pow(a, d, m)
+        if x in (1, m-1):
+            continue
+        for _ in range(s-1):
+            x = x*x % m
+            if x == m-1:
+                break
+        else:
+            return False
+    return True
+
 def polytrim(p, tol=1e-9):
     r"""Remove all leading near zero (`abs(a_i)<=tol`) coefficients.
     
@@ -5,9 +5,10 @@ from random import gauss, randint
 from functools import reduce
 from itertools import islice
 from fractions import Fraction
-from math import sqrt, pi, factorial, isclose
+from math import sqrt, pi, factorial, comb, isclose, lgamma
 import sympy as sp
 from sympy.abc import x as spx
+import pytest
 
 
 
@@ -91,7 +92,7 @@ def test_hermdoti():
 
 #evaluation
 def test_hermval():
-    for method in {'naive', 'iterative', 'clenshaw'}:
+    for method in {'naive', 'iterative', 'clenshaw', 'vectorised'}:
         for _ in range(100):
             h = np.random.rand(np.random.randint(0, 10)).tolist()
             x = 2*np.random.rand()-1
@@ -101,6 +102,113 @@ def test_hermval():
             assert np.isclose(prediction, actual)
         assert hermval(hermzero, x) == 0
 
+def test_hermval_rational():
+    for _ in range(100):
+        h = [Fraction(randint(-99, 99), randint(1, 30)) if randint(0, 1) else randint(-99, 99) for _ in range(randint(0, 12))]
+        x = Fraction(randint(-99, 99), randint(1, 50)) if randint(0, 1) else randint(-5, 5)
+        prediction = hermval(h, x, 'rational')
+        assert prediction == hermval_clenshaw(h, Fraction(x)) and isinstance(prediction, Fraction)
+
+def test_hermval_vectorised():
+    for _ in range(100):
+        h = np.random.rand(np.random.randint(0, 20))
+        x = np.random.randn(*np.random.randint(0, 5, size=np.random.randint(0, 3)))
+        prediction = hermval_vectorised(h, x)
+        actual = np.polynomial.hermite.hermval(x, h) if h.size else np.zeros_like(x)
+        assert prediction.shape == np.shape(x) and np.allclose(prediction, actual)
+
+def test_hermvander():
+    for n in range(20):
+        x = np.random.randn(*np.random.randint(0, 5, size=np.random.randint(0, 3)))
+        assert np.allclose(hermvander(x, n), np.polynomial.hermite.hermvander(x, n))
+
+def test_hermfunval():
+    x = 5 * np.random.randn(10)
+    for n in range(40):
+        c = np.random.rand(n)
+        norms = np.sqrt([2.0**k * factorial(k) * sqrt(pi) for k in range(n)])
+        actual = np.polynomial.hermite.hermval(x, c/norms) * np.exp(-x**2/2) if n else np.zeros_like(x)
+        for method in {'recurrence', 'clenshaw'}:
+            assert np.allclose(hermfunval(c, x, method), actual)
+    #high degrees: psi_{2m}(0) = (-1)^m/pi^(1/4) sqrt((2m)!)/(2^m m!)
+    for m in (100, 1000):
+        c = [0]*(2*m) + [1]
+        actual = (-1)**m * np.exp(-np.log(pi)/4 + lgamma(2*m+1)/2 - m*np.log(2) - lgamma(m+1))
+        for method in {'recurrence', 'clenshaw'}:
+            assert isclose(hermfunval(c, 0.0, method), actual, rel_tol=1e-11)
+    #rescaling at scalar points
+    c = np.random.rand(3000)
+    for method in {'recurrence', 'clenshaw'}:
+        assert isclose(hermfunval(c, 30.0, method), hermfunvander([30.0], 2999)[0] @ c, rel_tol=1e-9, abs_tol=1e-12)
+    with pytest.raises(ValueError, match='Invalid method'):
+        hermfunval((1, 2), 0.5, 'I dont want to do this anymore')
+
+def test_hermfunvander():
+    for n in range(20):
+        x = 5 * np.random.randn(*np.random.randint(0, 5, size=np.random.randint(0, 3)))
+        c = np.random.rand(n+1)
+        assert hermfunvander(x, n).shape == np.shape(x) + (n+1,)
+        assert np.allclose(hermfunvander(x, n) @ c, hermfunval(c, x))
+        actual = np.reshape([tuple(islice(hermfunvals(xi), n+1)) for xi in np.ravel(x)], (-1, n+1))
+        assert np.allclose(hermfunvander(np.ravel(x), n), actual)
+    #orthonormality by Gauss-Hermite quadrature
+    x, w = np.polynomial.hermite.hermgauss(200)
+    V = hermfunvander(x, 199)
+    assert np.allclose(V.T @ ((w * np.exp(x**2))[:, np.newaxis] * V), np.eye(200))
+
+def test_hermgauss():
+    for n in (1, 2, 3, 10, 99, 100, 101, 150, 300): #numpy's weights overflow at n=400
+        x, w = hermgauss(n)
+        X, W = np.polynomial.hermite.hermgauss(n)
+        assert np.allclose(x, X, rtol=0, atol=1e-13) and np.allclose(w, W, rtol=1e-12, atol=0)
+        xs, ws = hermgauss(n, scaled=True)
+        assert np.array_equal(x, xs) and np.allclose(ws * np.exp(-x**2), W, rtol=1e-12, atol=0)
+        assert not x.flags.writeable and hermgauss(n) is hermgauss(n)
+    #many nodes: exact for polynomials up to degree 2n-1
+    x, w = hermgauss(1000, scaled=True)
+    V = hermfunvander(x, 999)
+    assert np.allclose(V.T @ (w[:, np.newaxis] * V), np.eye(1000))
+    with pytest.raises(ValueError):
+        hermgauss(0)
+
+def test_hermfit():
+    for _ in range(10):
+        n = randint(0, 30)
+        #well conditioned coefficients of the scale of the orthonormal functions
+        norm = np.array([sqrt(2**k * factorial(k)) for k in range(n+1)])
+        h = np.random.uniform(-1, +1, n+1) / norm
+        assert np.allclose(hermfit(lambda x: hermval_vectorised(h, x), n) * norm, h * norm)
+        N = randint(n+1, 60)
+        assert np.allclose(hermfit(hermval_vectorised(h, hermgauss(N)[0]), n, N) * norm, h * norm)
+    #generating function
+    t = 1/2
+    c = hermfit(lambda x: np.exp(2*t*x - t*t), 20, 40)
+    assert np.allclose(c, [t**k / factorial(k) for k in range(21)], rtol=0, atol=1e-14)
+    assert np.allclose(hermfit(lambda x: 1.0, 3, 6), (1, 0, 0, 0))
+    #complex values
+    c = hermfit(lambda x: np.exp(2j*t*x + t*t), 20, 40)
+    assert np.allclose(c, [(1j*t)**k / factorial(k) for k in range(21)], rtol=0, atol=1e-14)
+    assert np.allclose(hermfit(lambda x: 1j, 3), (1j, 0, 0, 0))
+    assert np.allclose(hermfit(1j*np.ones(4), 3), (1j, 0, 0, 0))
+    with pytest.raises(ValueError):
+        hermfit(np.exp, 3, 3)
+    with pytest.raises(ValueError):
+        hermfit(np.ones(4), 3, 5)
+
+def test_PolyFitter_hermvander():
+    x, y = 2*np.random.rand(1000)-1, np.random.randn(1000)
+    F = PolyFitter(7, vander=hermvander)
+    for i in range(0, x.size, 99):
+        F.add(x[i:i+99], y[i:i+99])
+    assert np.allclose(F.fit(), np.polynomial.hermite.hermfit(x, y, 7))
+
+def test_hermval_mod():
+    for _ in range(100):
+        h, x, m = [randint(-10**9, 10**9) for _ in range(randint(0, 20))], randint(-10**5, 10**5), randint(2, 10**6)
+        assert hermval_mod(h, x, m) == hermval(h, x) % m
+    h = [randint(-100, 100) for _ in range(30)]
+    assert polyeq_probabilistic(herm2poly(h), lambda x, m: hermval_mod(h, x, m), n=29)
+
 def test_hermvalzero():
     assert tuple(islice(hermvalzeros(), 20)) == tuple(hermval(vecbasis(i), 0) for i in range(20))
     for _ in range(100):
@@ -152,13 +260,39 @@ def test_hermdivmod():
     h, a = (1, 2, 3), 2
     hermscalardivmod(h, a) == (hermscalartruediv(h, a), hermscalarmod(h, a))
 
+def test_hermlinearisation(monkeypatch):
+    for i in range(15):
+        for j in range(15):
+            c = hermlinearisation(i, j)
+            assert c == tuple(2**k*factorial(k)*comb(i, k)*comb(j, k) for k in range(min(i, j)+1))
+            assert c == hermlinearisation(j, i)
+            #H_i*H_j in monomial basis
+            h = [0] * (i+j+1)
+            for k, ck in enumerate(c):
+                h[i+j-2*k] += ck
+            assert polyeq(herm2poly(h), polymul(herm(i), herm(j)))
+    
+    #repeated products above degree 255 hit the cache
+    from poly.hermite.arithmetic import _hermlinearisations, _hermlinearisation
+    calls = []
+    monkeypatch.setattr(_hermlinearisations, 'entry', lambda i, j: calls.append((i, j)) or _hermlinearisation(i, j))
+    _hermlinearisations.clear()
+    h = tuple(range(400))
+    assert hermmulHn(h, 300) == hermmulHn(h, 300)
+    assert len(calls) == 400
+    assert 0 < _hermlinearisations.nbytes <= _hermlinearisations.maxbytes
+    #beyond the cap nothing is cached
+    monkeypatch.setattr(_hermlinearisations, 'maxbytes', _hermlinearisations.nbytes)
+    assert hermlinearisation(500, 300) == hermlinearisation(500, 300)
+    assert len(calls) == 402
+
 def test_hermmul():
     assert hermmul() == hermone
     assert hermmul(hermzero) == hermzero
     assert hermmul(hermone) == hermone
     assert hermmul(hermx) == hermx
     
-    for method in {'naive'}:
+    for method in {'naive', 'convert', 'quadrature'}:
         for _ in range(100):
             g = np.random.rand(np.random.randint(0, 5))
             h = np.random.rand(np.random.randint(0, 5))
@@ -166,6 +300,23 @@ def test_hermmul():
             prediction = hermmul(g, h, method=method)
             actual = np.polynomial.hermite.hermmul(g, h) if g.size and h.size else []
             assert np.allclose(prediction, actual)
+    
+    #exact
+    for _ in range(20):
+        g = [randint(-9, 9) for _ in range(randint(0, 30))]
+        h = [randint(-9, 9) for _ in range(randint(0, 30))]
+        assert hermmul(g, h, method='convert') == hermmul(g, h)
+    assert hermmul((Fraction(1, 3), Fraction(2, 7)), (1, 2), method='convert') \
+        == hermmul((Fraction(1, 3), Fraction(2, 7)), (1, 2))
+    #floats, accurate for low degrees
+    for _ in range(20):
+        g = [gauss(0, 1) for _ in range(randint(1, 11))]
+        h = [gauss(0, 1) for _ in range(randint(1, 11))]
+        naive = hermmul(g, h)
+        assert np.allclose(hermmul(g, h, method='convert'), naive, rtol=0, atol=1e-8*np.max(np.abs(naive)))
+    
+    with pytest.raises(ValueError, match='Invalid method'):
+        hermmul((1, 2), (3, 4), method='I dont want to do this anymore')
 
 def test_hermmulx():
     assert hermmulx(hermzero) == (0,)
@@ -185,7 +336,7 @@ def test_hermmulHn():
         assert np.allclose(hermmulHn(h, n), hermmul(h, vecbasis(n)))
 
 def test_hermpow():
-    for method in {'naive', 'binary'}:
+    for method in {'naive', 'binary', 'quadrature'}:
         assert hermpow(hermzero, 0) == hermone
         assert hermpow(hermzero, 1) == hermzero
         assert hermpow(hermzero, 2) == hermzero
@@ -224,6 +375,60 @@ def test_hermantider():
         actual = hermaddc(actual, hermvalzero(prediction))
         assert np.allclose(prediction, actual)
 
+#orthonormal
+def test_herm2hermo():
+    for _ in range(20):
+        h = np.random.uniform(-1, +1, randint(0, 20))
+        assert np.allclose(herm2hermo(h), [hi*sqrt(hermweight(i)) for i, hi in enumerate(h)])
+        assert np.allclose(hermo2herm(herm2hermo(h)), h)
+    #beyond the float range of 2^k*k!
+    h = hermo2herm(np.ones(251))
+    assert h[-1] > 0 and np.allclose(herm2hermo(h), 1)
+
+def test_hermodot():
+    for _ in range(20):
+        g = np.random.uniform(-1, +1, randint(0, 10))
+        h = np.random.uniform(-1, +1, randint(0, 10))
+        assert isclose(hermodot(herm2hermo(g), herm2hermo(h)), hermdot(g, h), abs_tol=1e-9)
+        assert isclose(hermoabsq(herm2hermo(h)), hermabsq(h), abs_tol=1e-9)
+        assert isclose(hermoabs(herm2hermo(h)), hermabs(h), abs_tol=1e-9)
+
+def test_hermomul():
+    for _ in range(20):
+        g = np.random.uniform(-1, +1, randint(0, 10))
+        h = np.random.uniform(-1, +1, randint(0, 10))
+        prediction = hermomul(herm2hermo(g), herm2hermo(h))
+        actual = herm2hermo(hermmul(g, h))
+        assert np.allclose(prediction, actual)
+    #high degree: x*H~_k = sqrt(k/2)*H~_{k-1} + sqrt((k+1)/2)*H~_{k+1}
+    h = hermorandn(300)
+    prediction = hermomul(h, herm2hermo(hermx))
+    actual = [(sqrt((k+1)/2)*h[k+1] if k+1 < len(h) else 0) + (sqrt(k/2)*h[k-1] if k else 0) for k in range(len(h)+1)]
+    assert np.allclose(prediction, actual)
+
+def test_hermoder():
+    for _ in range(20):
+        h = np.random.uniform(-1, +1, randint(0, 10))
+        k = randint(0, 5)
+        assert np.allclose(hermoder(herm2hermo(h), k) or [0], herm2hermo(hermder(h, k)) or [0])
+    #high degree & order: sqrt(2^k (l+k)!/l!)
+    d = hermoder((1.0,)*300, 150)
+    assert len(d) == 150 and np.allclose(np.log(d), [(150*np.log(2) + lgamma(l+151) - lgamma(l+1))/2 for l in range(150)])
+
+def test_hermoval():
+    for _ in range(20):
+        h = np.random.uniform(-1, +1, randint(0, 10))
+        x = np.random.uniform(-3, +3, 5)
+        assert np.allclose(hermoval(herm2hermo(h), x), hermval_vectorised(h, x))
+    h = hermorandn(500)
+    x = np.random.uniform(-5, +5, 10)
+    assert np.allclose(hermoval(h, x) * np.exp(-x**2/2), hermfunval(h, x))
+
+def test_hermorandn():
+    for n in range(10):
+        h = hermorandn(n)
+        assert isinstance(h, tuple) and hermdeg(h)==n and isclose(hermoabs(h), 1)
+
 #sympy
 def test_hermsympify():
     assert hermsympify((1, 2, 3)) == sp.Poly.from_list([12, 4, -5], spx)
@@ -251,7 +456,7 @@ def test_polymono():
     assert polymono(3, 5) == (0, 0, 0, 5)
 
 def test_herm2poly():
-    for method in {'naive', 'iterative', 'clenshaw'}:
+    for method in {'naive', 'iterative', 'clenshaw', 'matrix'}:
         assert herm2poly(hermzero, method) == polyzero
         for _ in range(100):
             h = np.random.rand(np.random.randint(0, 10)).tolist()
@@ -260,6 +465,49 @@ def test_herm2poly():
             actual = np.polynomial.hermite.herm2poly(h) if h else []
             assert np.allclose(prediction, actual)
 
+def test_herm2poly_rational():
+    assert herm2poly_rational(hermzero) == polyzero
+    assert poly2herm_rational(polyzero) == hermzero
+    for _ in range(100):
+        h = [Fraction(randint(-9, 9), randint(1, 9)) for _ in range(randint(0, 20))]
+        p = herm2poly_rational(h)
+        assert p == herm2poly_clenshaw(h)
+        assert poly2herm_rational(p) == tuple(h)
+        assert poly2herm(p, 'rational') == poly2herm_horner(p)
+    assert herm2poly((1, 2, 3), 'rational') == herm2poly((1, 2, 3))
+    assert poly2herm((0, 0, 1), 'rational') == (Fraction(1, 2), 0, Fraction(1, 4))
+
+def test_herm2poly_matrix(monkeypatch):
+    for _ in range(100):
+        h = [randint(-9, 9) for _ in range(randint(0, 40))]
+        assert herm2poly_matrix(h) == herm2poly_clenshaw(h)
+        p = [Fraction(randint(-9, 9), randint(1, 9)) for _ in range(randint(0, 40))]
+        assert poly2herm_matrix(p) == poly2herm_horner(p)
+    
+    #many series at once
+    for n in range(1, 20):
+        H = np.random.rand(5, n)
+        assert np.allclose(herm2poly_matrix(H), [np.polynomial.hermite.herm2poly(h) for h in H])
+        assert np.allclose(poly2herm_matrix(H), [np.polynomial.hermite.poly2herm(h) for h in H])
+    
+    #exact object arrays
+    H = np.array([[randint(-9, 9) for _ in range(30)] for _ in range(3)], dtype=object)
+    assert [tuple(p) for p in herm2poly_matrix(H)] == [herm2poly_clenshaw(h) for h in H]
+    P = np.array([[Fraction(randint(-9, 9), randint(1, 9)) for _ in range(30)] for _ in range(3)], dtype=object)
+    assert [tuple(h) for h in poly2herm_matrix(P)] == [poly2herm_rational(p) for p in P]
+    
+    #caches grow to the degree needed & respect their memory cap
+    from poly.hermite.conversion import _herm2polyrows, _herm2polyarray
+    _herm2polyrows.clear(), _herm2polyarray.clear()
+    herm2poly_matrix((1,)*5), herm2poly_matrix(np.ones(7))
+    assert len(_herm2polyrows.rows) == 5 and _herm2polyarray.A.shape == (7, 7)
+    monkeypatch.setattr(_herm2polyrows, 'maxbytes', 1000)
+    monkeypatch.setattr(_herm2polyarray, 'maxbytes', 1000)
+    h = [randint(-9, 9) for _ in range(40)]
+    assert herm2poly_matrix(h) == herm2poly_clenshaw(h)
+    assert np.allclose(herm2poly_matrix(np.array(h, dtype=float)), np.array(herm2poly_clenshaw(h), dtype=float))
+    assert _herm2polyrows.nbytes <= 1000 and _herm2polyarray.A.nbytes <= 1000
+
 """
 def test_hermmono():
     for method in {'recursive', 'iterative', 'explicit'}:
@@ -1,9 +1,10 @@
 from poly import *
 import numpy as np
-from random import randint, random
+from random import randint, random, choice
 from functools import reduce
 from itertools import count, islice
 from fractions import Fraction
+from math import factorial
 from vector import vecrand
 import sympy as sp
 from sympy.abc import x as spx
@@ -67,6 +68,33 @@ def test_polyeq():
     assert not polyeq((1,), ())
     assert not polyeq((1, 2, 3), (1, 2, 4))
 
+def test_polyeq_probabilistic():
+    for _ in range(20):
+        p, q = [randint(-100, 100) for _ in range(randint(1, 10))], [randint(-100, 100) for _ in range(randint(1, 10))]
+        assert polyeq_probabilistic(p, p)
+        assert polyeq_probabilistic(p, q) == polyeq(polytrim(p, 0), polytrim(q, 0))
+        
+        #pipelines
+        pq = polymul(p, q)
+        assert polyeq_probabilistic(pq, lambda x, m: polyval_mod(p, x, m)*polyval_mod(q, x, m) % m, n=len(pq))
+        assert not polyeq_probabilistic(polyaddc(pq, 1), lambda x, m: polyval_mod(p, x, m)*polyval_mod(q, x, m) % m, n=len(pq))
+        pq = polycom(p, q)
+        assert polyeq_probabilistic(pq, lambda x, m: polyval_mod(p, polyval_mod(q, x, m), m), n=len(pq))
+    
+    assert polyeq_probabilistic(polyzero, (0, 0))
+    assert not polyeq_probabilistic(polyzero, (1,))
+    with pytest.raises(ValueError):
+        polyeq_probabilistic(lambda x, m: 0, polyzero)
+    #multiples of a fixed modulus
+    assert not polyeq_probabilistic((2**61-1,), (0,))
+    assert not polyeq_probabilistic((0, 2**61-1), (0,))
+    assert not polyeq_probabilistic((0, 2**61-1), lambda x, m: 0, n=1)
+    #degree bound too large for the modulus size
+    with pytest.raises(ValueError):
+        polyeq_probabilistic((1,)*10, (1,)*10, bits=4)
+    with pytest.raises(ValueError):
+        polyeq_probabilistic(lambda x, m: 0, polyzero, n=2**62)
+
 def test_polytrim():
     assert polytrim(()) == ()
     assert polytrim((0,)) == ()
@@ -79,21 +107,22 @@ def test_polyval():
     for _ in range(1000):
         p, x = polyrand(randint(1, 10)), random()
         actual = np.polynomial.polynomial.polyval(x, p)
-        for method in ('naive', 'iterative', 'horner'):
+        for method in ('naive', 'iterative', 'horner', 'paterson_stockmeyer'):
             assert np.isclose(polyval(p, x, method), actual)
     
     #empty polynomial
     assert polyval(polyzero, x, 'naive') \
             == polyval(polyzero, x, 'iterative') \
-            == polyval(polyzero, x, 'horner') == 0
+            == polyval(polyzero, x, 'horner') \
+            == polyval(polyzero, x, 'paterson_stockmeyer') == 0
     
     #type consistency
     p, x = polyzero, Fraction(5, 2)
-    for method in ('naive', 'iterative', 'horner'):
+    for method in ('naive', 'iterative', 'horner', 'paterson_stockmeyer', 'rational'):
         assert polyval(p, x, method) == 0 \
         and isinstance(polyval(p, x, method), Fraction)
     p, y = (1, 2, 3), Fraction(99, 4)
-    for method in ('naive', 'iterative', 'horner'):
+    for method in ('naive', 'iterative', 'horner', 'paterson_stockmeyer', 'rational'):
         assert polyval(p, x, method) == y \
                 and isinstance(polyval(p, x, method), Fraction)
     
@@ -103,12 +132,92 @@ def test_polyval():
 
 #polyvals gets tested with polyval_iterative
 
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_polyval_paterson_stockmeyer():
+    #matrix arguments with scalar coefficients
+    I = np.asmatrix(np.eye(5))
+    for _ in range(20):
+        p = polyrand(randint(1, 40))
+        x = np.asmatrix(np.random.rand(5, 5) / 5)
+        actual = sum(ai * np.linalg.matrix_power(x, i) for i, ai in enumerate(p))
+        assert np.allclose(polyval_paterson_stockmeyer(p, x, one=I), actual)
+    #exact
+    for n in range(20):
+        p, x = tuple(range(1, n+2)), Fraction(2, 3)
+        assert polyval_paterson_stockmeyer(p, x) == polyval_horner(p, x)
+
 def test_polyvalzero():
     assert polyvalzero(polyzero) == 0
     assert polyvalzero(polyone) == 1
     assert polyvalzero(polyx) == 0
     assert polyvalzero((5, 4, 3)) == 5
 
+def test_PolyGrid():
+    xs = np.linspace(-1, 1, 50)
+    for maxbytes in (None, 0, 8*50*5):
+        grid = PolyGrid(xs, maxbytes=maxbytes)
+        for _ in range(20):
+            p = polyrand(randint(0, 10))
+            assert np.allclose(grid(p), np.polynomial.polynomial.polyval(xs, p) if p else 0)
+        ps = np.random.rand(4, 8)
+        assert np.allclose(grid(ps), np.polynomial.polynomial.polyval(xs, ps.T))
+        assert np.allclose(grid.vander(6), np.polynomial.polynomial.polyvander(xs, 6))
+    assert grid._V.nbytes <= 8*50*5
+    grid.clear()
+    assert grid._V.shape == (50, 1)
+    
+    #integer grids are promoted instead of wrapping around
+    assert np.allclose(PolyGrid([1, 2, 3])((0,)*70+(1,)), [1, 2.0**70, 3.0**70])
+
+def test_polyval_rational():
+    for _ in range(100):
+        p = [Fraction(randint(-99, 99), randint(1, 30)) if random()<0.5 else randint(-99, 99) for _ in range(randint(0, 12))]
+        x = Fraction(randint(-99, 99), randint(1, 50)) if random()<0.5 else randint(-5, 5)
+        assert polyval_rational(p, x) == polyval_horner(p, Fraction(x))
+    assert isinstance(polyval_rational((1, 2), 3), Fraction)
+
+def test_polyval_mod():
+    for _ in range(100):
+        p, x, m = [randint(-10**9, 10**9) for _ in range(randint(0, 20))], randint(-10**5, 10**5), randint(2, 10**6)
+        assert polyval_mod(p, x, m) == polyval(p, x) % m
+
+def test_polyval_unity():
+    p = np.random.randn(50)
+    for N in (1, 7, 64, 100):
+        w = np.exp(2j*np.pi*np.arange(N)/N)
+        assert np.allclose(polyval_unity(p, N), np.polynomial.polynomial.polyval(w, p))
+    assert np.allclose(polyval_unity(polyzero, 3), 0)
+    with pytest.raises(ValueError):
+        polyval_unity(p, 0)
+
+def test_polyval_geometric():
+    p = np.random.randn(50)
+    for a, r, m in ((1, np.exp(0.1j), 30), (0.5+0.2j, np.exp(-0.3j), 80), (1, 1.001, 5), (-0.9, np.exp(2j), 1)):
+        z = a * r**np.arange(m)
+        assert np.allclose(polyval_geometric(p, a, r, m), np.polynomial.polynomial.polyval(z, p))
+    assert np.allclose(polyval_geometric(polyzero, 1, 1, 3), (0, 0, 0))
+    assert np.allclose(polyval_geometric((1, 2, 3), 2, 0, 4), (17, 1, 1, 1))
+    assert np.allclose(polyval_geometric((1, 2, 3), 2, 0, 1), (17,))
+    assert np.allclose(polyval_geometric((3,), 1, 2, 2), (3, 3))
+
+def test_polyvalder():
+    for _ in range(100):
+        p, x, k = polyrand(randint(0, 10)), random(), randint(0, 12)
+        prediction = polyvalder(p, x, k)
+        actual = tuple(polyval(polyder(p, j), x) for j in range(k+1))
+        assert len(prediction) == k+1 and np.allclose(prediction, actual)
+    
+    #exact & taylor coefficients
+    p, x = (1, 2, 3, 4), Fraction(1, 3)
+    assert polyvalder(p, x, 4) == (Fraction(58, 27), Fraction(16, 3), 14, 24, 0)
+    assert polyvalder(p, x, 3, taylor=True) == (Fraction(58, 27), Fraction(16, 3), 7, 4)
+    assert polyvalder(polyzero, x, 2) == (0, 0, 0)
+    
+    #mutable coefficients are not modified
+    p = (np.array([1., 2.]), np.array([3., 4.]), np.array([5., 6.]))
+    polyvalder(p, 2.0, 2)
+    assert all(np.array_equal(pi, qi) for pi, qi in zip(p, ([1., 2.], [3., 4.], [5., 6.])))
+
 def test_polycom():
     def nppolycom(p, q):
         p = np.polynomial.polynomial.Polynomial(p)
@@ -121,12 +230,19 @@ def test_polycom():
         prediction0 = polycom(p, q, 'naive')
         prediction1 = polycom(p, q, 'iterative')
         prediction2 = polycom(p, q, 'horner')
+        prediction3 = polycom(p, q, 'divconq')
         actual = nppolycom(p, q)
         assert np.allclose(prediction0, actual)
         assert np.allclose(prediction1, actual)
         assert np.allclose(prediction2, actual)
+        assert np.allclose(prediction3, actual)
+    
+    for _ in range(100):
+        p = tuple(randint(-10, +10) for _ in range(randint(0, 20)))
+        q = tuple(randint(-10, +10) for _ in range(randint(0, 5)))
+        assert polycom(p, q, 'divconq') == polycom(p, q, 'iterative')
     
-    for method in {'naive', 'iterative', 'horner'}:
+    for method in {'naive', 'iterative', 'horner', 'divconq'}:
         assert polycom(polyzero, polyzero, method) == polyzero
         assert polycom(polyzero, polyone, method) == polyzero
         assert polycom((4, 5, 6), polyzero, method) == (4,)
@@ -134,10 +250,61 @@ def test_polycom():
     with pytest.raises(ValueError, match='Invalid method'):
         polycom((1, 2, 3), (4, 5, 6), method='I dont want to do this anymore')
 
+def test_polycom_brentkung():
+    for _ in range(100):
+        p = tuple(randint(-10, +10) for _ in range(randint(0, 20)))
+        q = tuple(randint(-10, +10) for _ in range(randint(0, 5)))
+        n = randint(0, 30)
+        assert polyeq(polycom_brentkung(p, q, n), polycom(p, q)[:n])
+    assert polycom_brentkung(polyzero, polyx, 5) == polyzero
+    assert polycom_brentkung((1, 2, 3), polyx, 0) == polyzero
+
+def test_polyrevert_series():
+    for _ in range(20):
+        n = randint(2, 40)
+        p = (0, choice((1, -1))) + tuple(randint(-5, 5) for _ in range(randint(0, 30)))
+        q = polyrevert_series(p, n)
+        assert polyeq(polycom(p, q)[:n], polyx)
+        assert polyeq(polycom(q, p)[:n], polyx)
+        assert len(q) <= n
+    
+    #Catalan numbers from x-x^2, log(1+x) from exp(x)-1
+    assert polyrevert_series((0, 1, -1), 8) == (0, 1, 1, 2, 5, 14, 42, 132)
+    p = (0,) + tuple(Fraction(1, factorial(k)) for k in range(1, 10))
+    assert polyrevert_series(p, 8) == (0,) + tuple(Fraction((-1)**(k+1), k) for k in range(1, 8))
+    
+    assert polyrevert_series((0, 1), 1) == polyzero
+    with pytest.raises(ValueError):
+        polyrevert_series((1, 1), 5)
+    for p in (polyzero, (0,), (0, 0, 1)):
+        with pytest.raises(ValueError):
+            polyrevert_series(p, 5)
+
 def test_polyshift():
-    assert polyshift(polyzero, 5) == polyzero
-    assert polyshift(polyone, 5) == polyone
-    assert polyshift((1, 2, 3), 5) == polycom((1, 2, 3), polyaddc(polyx, -5))
+    for method in ('naive', 'horner'):
+        assert polyshift(polyzero, 5, method=method) == polyzero
+        assert polyshift(polyone, 5, method=method) == polyone
+        assert polyshift((1, 2, 3), 5, method=method) == polycom((1, 2, 3), polyaddc(polyx, -5))
+        for _ in range(100):
+            p = tuple(randint(-100, +100) for _ in range(randint(0, 20)))
+            s = randint(-10, +10)
+            assert polyshift(p, s, method=method) == polycom(p, (-s, 1))
+    
+    for _ in range(100):
+        p, s = polyrand(randint(0, 10)), random()
+        assert np.allclose(polyshift(p, s, method='horner'), polycom(p, (-s, 1)))
+    assert polyshift((1, 2, 3), Fraction(1, 2)) == (Fraction(3, 4), -1, 3)
+    
+    #positional unit of the baseline signature
+    assert polyshift((1, 2, 3), 5, 1) == polycom((1, 2, 3), (-5, 1))
+    
+    #mutable coefficients are not modified
+    p = (np.array([1., 2.]), np.array([3., 4.]), np.array([5., 6.]))
+    polyshift(p, 1)
+    assert all(np.array_equal(pi, qi) for pi, qi in zip(p, ([1., 2.], [3., 4.], [5., 6.])))
+    
+    with pytest.raises(ValueError, match='Invalid method'):
+        polyshift((1, 2, 3), 4, method='I dont want to do this anymore')
 
 def test_polyscale():
     assert polyscale(polyzero, 5) == polyzero
@@ -209,6 +376,17 @@ def test_polymulx():
         p = polyrand(randint(1, 10))
         assert np.allclose(polymulx(p), np.polynomial.polynomial.polymulx(p))
 
+def test_polyinv_series():
+    for _ in range(100):
+        n = randint(0, 40)
+        p = (choice((1, -1)),) + tuple(randint(-10, 10) for _ in range(randint(0, 30)))
+        assert polyeq(polymul(p, polyinv_series(p, n))[:n], polyone if n else polyzero)
+    assert polyinv_series((1, -1), 5) == (1, 1, 1, 1, 1)
+    assert polyinv_series((Fraction(2), 1), 3) == (Fraction(1, 2), Fraction(-1, 4), Fraction(1, 8))
+    for p in (polyzero, (0, 1)):
+        with pytest.raises(ValueError):
+            polyinv_series(p, 5)
+
 def test_polypow():
     for method in {'naive', 'binary'}:
         for _ in range(1000):
@@ -251,6 +429,176 @@ def test_polyantider():
     assert polyantider(polyone) == polyx
 
 
+#roots
+def test_polyroots():
+    for method in ('aberth', 'companion'):
+        for _ in range(100):
+            n = randint(1, 10)
+            r = np.random.randn(n) + 1j*np.random.randn(n)
+            p = np.polynomial.polynomial.polyfromroots(r)
+            prediction = polyroots(p, method)
+            assert prediction.shape == r.shape
+            assert all(np.min(np.abs(prediction-ri)) < 1e-6 for ri in r)
+        
+        #high degree
+        p = polyrandn(200)
+        prediction = polyroots(p, method)
+        actual = np.polynomial.polynomial.polyroots(p)
+        assert prediction.size == 200
+        assert all(np.min(np.abs(prediction-ai)) < 1e-6 for ai in actual)
+        
+        assert polyroots(polyzero, method).size == 0
+        assert polyroots(polyone, method).size == 0
+        assert np.allclose(polyroots((0, 0, 1, 0), method), 0)
+    
+    with pytest.raises(ValueError, match='Invalid method'):
+        polyroots((1, 2, 3), method='I dont want to do this anymore')
+
+def test_polyroots_batch():
+    for d in range(5):
+        r = np.random.randn(1000, d) + 1j*np.random.randn(1000, d)*(np.random.rand(1000, 1)<0.5)
+        P = np.stack([np.polynomial.polynomial.polyfromroots(ri) for ri in r]) if d else np.ones((1000, 1))
+        prediction = polyroots_batch(P)
+        assert prediction.shape == (1000, d)
+        for x, ri in zip(prediction, r):
+            assert np.allclose(np.sort_complex(x), np.sort_complex(ri), atol=1e-6)
+    
+    #multiple roots & biquadratic
+    assert np.allclose(polyroots_batch([(1, 2, 1)]), -1)
+    assert np.allclose(polyroots_batch([(1, 3, 3, 1)]), -1)
+    assert np.allclose(polyroots_batch([(1, 4, 6, 4, 1)]), -1, atol=1e-6)
+    assert np.allclose(np.sort_complex(polyroots_batch([(1, 0, -2, 0, 1)])[0]), (-1, -1, 1, 1))
+    assert np.allclose(polyroots_batch([(0, 0, 0, 0, 1)]), 0)
+    
+    with pytest.raises(ValueError):
+        polyroots_batch(np.ones((2, 6)))
+
+def test_polysignvar():
+    assert polysignvar((1, -2, 0, 3, 0, -1)) == 3
+    assert polysignvar((0, 0, 1)) == 0
+    assert polysignvar(polyzero) == 0
+
+def test_polyisolate():
+    for _ in range(100):
+        r = sorted({randint(-20, 20) for _ in range(randint(1, 8))})
+        p = polyfromroots(*r, *r[:randint(0, len(r))]) #with multiplicities
+        p = polyscalarmul(randint(-3, 3) or 1, p)
+        intervals = polyisolate(p)
+        assert len(intervals) == len(r)
+        assert all(a < ri < b or a == ri == b for ri, (a, b) in zip(r, intervals))
+    
+    #irrational roots
+    p = polymul((-2, 0, 1), (-3, 0, 0, 1), (1, 1, 1)) #±sqrt(2), cbrt(3)
+    intervals = polyisolate(p)
+    assert len(intervals) == 3
+    for x, (a, b) in zip(sorted((-2**0.5, 2**0.5, 3**(1/3))), intervals):
+        assert a < x < b
+    
+    #compared to floating point roots (squarefree, numpy repeats multiple roots)
+    for _ in range(20):
+        p = (randint(1, 10),) + tuple(randint(-10, 10) for _ in range(randint(1, 29)))
+        if not polysympify(p).is_sqf:
+            continue
+        actual = np.polynomial.polynomial.polyroots(polytrim(p, 0)) if polydeg(polytrim(p, 0)) > 0 else []
+        actual = sorted(x.real for x in actual if abs(x.imag) < 1e-9)
+        intervals = polyisolate(p)
+        assert len(intervals) == len(actual)
+        for x, (a, b) in zip(actual, intervals):
+            assert a-1e-6 <= x <= b+1e-6
+    
+    assert polyisolate(polyzero) == []
+    assert polyisolate(polyone) == []
+    assert polyisolate((1, 0, 1)) == []
+    assert polyisolate((0, 0, 0, 7)) == [(0, 0)]
+
+
+
+#interpolation
+def test_PolyBarycentric():
+    for _ in range(20):
+        n = randint(1, 15)
+        xs, p = np.random.permutation(np.linspace(-1, 1, n)), polyrandn(n-1)
+        ys = np.polynomial.polynomial.polyval(xs, p)
+        P = PolyBarycentric(xs, ys)
+        x = 2*np.random.rand(10)-1
+        assert np.allclose(P(x), np.polynomial.polynomial.polyval(x, p))
+        assert np.allclose(P(x[0]), np.polynomial.polynomial.polyval(x[0], p))
+        assert np.all(P(xs) == ys)
+        
+        #incremental
+        Q = PolyBarycentric(xs[:-1], ys[:-1])
+        Q.add(xs[-1], ys[-1])
+        assert len(Q) == n
+        assert np.allclose(Q(x), P(x))
+    
+    #high degree on Chebyshev nodes
+    n = 2000
+    xs = np.cos(np.pi*(np.arange(n+1)+0.5)/(n+1))
+    P = PolyBarycentric(xs, np.exp(xs))
+    x = np.linspace(-1, 1, 101)
+    assert np.allclose(P(x), np.exp(x))
+    
+    assert PolyBarycentric()(1.5) == 0
+    with pytest.raises(ValueError):
+        PolyBarycentric((1, 1), (2, 3))
+    with pytest.raises(ValueError):
+        PolyBarycentric((1, 2), (2,))
+
+def test_PolyNewton():
+    for _ in range(20):
+        n = randint(1, 10)
+        p = tuple(Fraction(randint(-10, 10), randint(1, 5)) for _ in range(n))
+        xs = [Fraction(int(x)) for x in np.random.permutation(np.arange(-n, n))[:n]]
+        P = PolyNewton()
+        for k, x in enumerate(xs, 1):
+            P.add(x, polyval(p, x))
+            assert len(P) == k
+            #interpolant of the first k points
+            q = P.poly()
+            assert all(polyval(q, xi) == polyval(p, xi) for xi in xs[:k])
+            assert len(q) == k
+        assert P.poly() == p
+        x = Fraction(randint(-100, 100), 7)
+        assert P(x) == polyval(p, x)
+        assert PolyNewton(xs, [polyval(p, x) for x in xs]).poly() == p
+    
+    assert PolyNewton().poly() == polyzero
+    assert PolyNewton()(Fraction(1, 2)) == 0
+    with pytest.raises(ValueError):
+        PolyNewton((1, 1), (2, 3))
+    P = PolyNewton((Fraction(1), Fraction(2)), (3, 4))
+    with pytest.raises(ValueError):
+        P.add(Fraction(2), 5)
+    assert len(P) == 2 and P.poly() == (2, 1)
+
+def test_polyfit():
+    for method in ('qr', 'normal'):
+        for _ in range(20):
+            n = randint(0, 8)
+            x, y = 2*np.random.rand(100)-1, np.random.randn(100)
+            assert np.allclose(polyfit(x, y, n, method=method), np.polynomial.polynomial.polyfit(x, y, n))
+            w = np.random.rand(100)
+            assert np.allclose(polyfit(x, y, n, w, method=method), np.polynomial.polynomial.polyfit(x, y, n, w=w))
+        assert np.allclose(polyfit(x, y, n, vander=np.polynomial.hermite.hermvander), np.polynomial.hermite.hermfit(x, y, n))
+        
+        #exact
+        p = polyrandn(5)
+        x = np.linspace(-1, 1, 10)
+        assert np.allclose(polyfit(x, np.polynomial.polynomial.polyval(x, p), 5, method=method), p)
+    
+    with pytest.raises(ValueError, match='Invalid method'):
+        polyfit((1, 2), (3, 4), 1, method='I dont want to do this anymore')
+
+def test_PolyFitter():
+    for method in ('qr', 'normal'):
+        x, y = 2*np.random.rand(10000)-1, np.random.randn(10000)
+        F = PolyFitter(7, method=method)
+        assert F.fit() == (0.0,) * 8
+        for i in range(0, x.size, 999):
+            F.add(x[i:i+999], y[i:i+999])
+        assert F.count == x.size
+        assert np.allclose(F.fit(), np.polynomial.polynomial.polyfit(x, y, 7))
+
 #sympy
 def test_polysympify():
     assert polysympify((1, 2, 3)) == sp.Poly(1+2*spx+3*spx**2)